@@ -9,7 +9,8 @@ This script demonstrates the capabilities of the EDI parser by:
 """
 
 import sys
-import json
+from io import StringIO
+from itertools import islice
 from pathlib import Path
 
 # Add src to path
@@ -18,11 +19,32 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.parser.edi_parser import EDIParser
 
 
+# Console decorations, built once at import
+_BAR = "=" * 70
+_BANNER = "\n".join([
+    "",
+    "╔" + "═" * 68 + "╗",
+    "║" + " " * 20 + "EDI PARSER DEMONSTRATION" + " " * 24 + "║",
+    "╚" + "═" * 68 + "╝",
+])
+
+
+def print_lines(lines):
+    """Print a batch of lines with a single write to stdout."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
+def _fmt_cents(amount: str) -> str:
+    """Format an implied-decimal cents amount (e.g. TDS01) as dollars."""
+    cents = int(amount)
+    sign = "-" if cents < 0 else ""
+    whole, cents = divmod(abs(cents), 100)
+    return f"${sign}{whole:,}.{cents:02d}"
+
+
 def print_header(text):
     """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {text}")
-    print("=" * 70)
+    print(f"\n{_BAR}\n  {text}\n{_BAR}")
 
 
 def demo_parse_850():
@@ -49,37 +71,46 @@ def demo_parse_850():
     print(f"  Complete Envelope:   {stats['has_envelope']}")
 
     print("\n  Segment Breakdown:")
-    for seg_id, count in sorted(stats['segment_counts'].items()):
-        print(f"    {seg_id:8} → {count:3} occurrence(s)")
+    print_lines(
+        f"    {seg_id:8} → {count:3} occurrence(s)"
+        for seg_id, count in stats['segment_counts'].items()
+    )
 
     # Show specific segments
     print("\n📦 KEY SEGMENTS:")
 
     # BEG segment
     beg = parser.get_segments_by_id("BEG")[0]
+    elements = beg['elements']
     print(f"\n  BEG (Beginning) - Line {beg['line']}:")
-    print(f"    Purpose Code:     {beg['elements'][1]}")
-    print(f"    PO Type:          {beg['elements'][2]}")
-    print(f"    PO Number:        {beg['elements'][3]}")
-    print(f"    Date:             {beg['elements'][5]}")
+    print(f"    Purpose Code:     {elements[1]}")
+    print(f"    PO Type:          {elements[2]}")
+    print(f"    PO Number:        {elements[3]}")
+    print(f"    Date:             {elements[5]}")
 
     # PO1 segments (line items)
     po1_segments = parser.get_segments_by_id("PO1")
     print(f"\n  PO1 (Line Items) - {len(po1_segments)} items:")
+    lines = []
     for idx, po1 in enumerate(po1_segments, 1):
-        print(f"    Item {idx} (Line {po1['line']}):")
-        print(f"      Quantity:       {po1['elements'][2]} {po1['elements'][3]}")
-        print(f"      Unit Price:     ${po1['elements'][4]}")
-        print(f"      Product ID:     {po1['elements'][7]}")
+        elements = po1['elements']
+        lines.append(f"    Item {idx} (Line {po1['line']}):")
+        lines.append(f"      Quantity:       {elements[2]} {elements[3]}")
+        lines.append(f"      Unit Price:     ${elements[4]}")
+        lines.append(f"      Product ID:     {elements[7]}")
+    print_lines(lines)
 
     # N1 segments (parties)
     n1_segments = parser.get_segments_by_id("N1")
     print(f"\n  N1 (Name/Address) - {len(n1_segments)} parties:")
+    lines = []
     for n1 in n1_segments:
-        qualifier = n1['elements'][1]
-        name = n1['elements'][2]
-        entity_id = n1['elements'][4] if len(n1['elements']) > 4 else "N/A"
-        print(f"    {qualifier} → {name} ({entity_id})")
+        elements = n1['elements']
+        qualifier = elements[1]
+        name = elements[2]
+        entity_id = elements[4] if len(elements) > 4 else "N/A"
+        lines.append(f"    {qualifier} → {name} ({entity_id})")
+    print_lines(lines)
 
     return result
 
@@ -98,10 +129,11 @@ def demo_parse_856():
 
     # Show BSN segment
     bsn = parser.get_segments_by_id("BSN")[0]
+    elements = bsn['elements']
     print(f"\n  BSN (Beginning Segment for ASN) - Line {bsn['line']}:")
-    print(f"    Shipment ID:    {bsn['elements'][2]}")
-    print(f"    Date:           {bsn['elements'][3]}")
-    print(f"    Time:           {bsn['elements'][4]}")
+    print(f"    Shipment ID:    {elements[2]}")
+    print(f"    Date:           {elements[3]}")
+    print(f"    Time:           {elements[4]}")
 
     return result
 
@@ -119,10 +151,11 @@ def demo_parse_810():
 
     # Show BIG segment
     big = parser.get_segments_by_id("BIG")[0]
+    elements = big['elements']
     print(f"\n  BIG (Beginning Segment for Invoice) - Line {big['line']}:")
-    print(f"    Invoice Date:   {big['elements'][1]}")
-    print(f"    Invoice Number: {big['elements'][2]}")
-    print(f"    PO Number:      {big['elements'][4]}")
+    print(f"    Invoice Date:   {elements[1]}")
+    print(f"    Invoice Number: {elements[2]}")
+    print(f"    PO Number:      {elements[4]}")
 
     # Show TDS segment (total amounts)
     tds = parser.get_segments_by_id("TDS")
@@ -130,7 +163,7 @@ def demo_parse_810():
         tds_seg = tds[0]
         amount = tds_seg['elements'][1]
         # Format as currency (amount is in cents)
-        formatted_amount = f"${int(amount)/100:,.2f}"
+        formatted_amount = _fmt_cents(amount)
         print(f"\n  TDS (Total Monetary Value):")
         print(f"    Invoice Total:  {formatted_amount}")
 
@@ -147,20 +180,18 @@ def demo_json_export():
     # Export to JSON
     json_output = parser.to_json(indent=2)
 
-    # Show first 50 lines
-    lines = json_output.split('\n')
+    # Show first 50 lines without splitting the whole document
     print("\n  First 50 lines of JSON output:\n")
-    for line in lines[:50]:
-        print(f"  {line}")
+    print_lines("  " + line.rstrip("\n") for line in islice(StringIO(json_output), 50))
 
-    if len(lines) > 50:
-        print(f"\n  ... ({len(lines) - 50} more lines)")
+    line_count = json_output.count('\n') + 1
+    if line_count > 50:
+        print(f"\n  ... ({line_count - 50} more lines)")
 
     # Save to file
     output_path = Path("output/sample_850_parsed.json")
     output_path.parent.mkdir(exist_ok=True)
-    with open(output_path, 'w') as f:
-        f.write(json_output)
+    output_path.write_text(json_output, encoding='utf-8')
 
     print(f"\n  ✓ Full JSON saved to: {output_path}")
 
@@ -189,9 +220,7 @@ def demo_invalid_handling():
 
 def main():
     """Run all demonstrations."""
-    print("\n" + "╔" + "═" * 68 + "╗")
-    print("║" + " " * 20 + "EDI PARSER DEMONSTRATION" + " " * 24 + "║")
-    print("╚" + "═" * 68 + "╝")
+    print(_BANNER)
 
     try:
         # Parse each document type
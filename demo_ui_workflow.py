@@ -12,6 +12,9 @@ This simulates what happens when a user:
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from itertools import islice
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -22,11 +25,91 @@ from src.validator.validation_engine import ValidationEngine
 from src.reporting.report_generator import ReportGenerator
 
 
+# Console decorations, built once at import
+_BAR = "=" * 70
+_BANNER = "\n".join([
+    "",
+    "╔" + "═" * 68 + "╗",
+    "║" + " " * 20 + "UI WORKFLOW DEMONSTRATION" + " " * 23 + "║",
+    "╚" + "═" * 68 + "╝",
+])
+
+
+# Parsed documents keyed by (path, mtime) so repeated workflows reuse one parse
+_PARSE_CACHE = {}
+
+# Merged rulesets keyed by (doc_type, retailer), loaded on first use
+_RULES = {}
+
+
+def _parse_once(path):
+    """Parse an EDI file once and reuse the result until the file changes."""
+    key = (path, Path(path).stat().st_mtime)
+    parsed_edi = _PARSE_CACHE.get(key)
+    if parsed_edi is None:
+        parsed_edi = EDIParser().parse_file(path)
+        _PARSE_CACHE[key] = parsed_edi
+    return parsed_edi
+
+
+def _get_rules(doc_type, retailer=None):
+    """Load and merge a ruleset once per (doc_type, retailer) combination."""
+    key = (doc_type, retailer)
+    rules = _RULES.get(key)
+    if rules is None:
+        rules = RuleLoader().load_rules(doc_type, retailer)
+        _RULES[key] = rules
+    return rules
+
+
+def _head_lines(data, count):
+    """Decode the first `count` lines of a byte buffer without splitting all of it."""
+    lines = []
+    pos = 0
+    for _ in range(count):
+        end = data.find(b'\n', pos)
+        if end < 0:
+            lines.append(data[pos:].decode('utf-8'))
+            break
+        lines.append(data[pos:end].decode('utf-8'))
+        pos = end + 1
+    return lines
+
+
+# Retailers compared in the comparison workflow (None = base rules only)
+COMPARISON_RETAILERS = (None, "walmart", "amazon", "target")
+
+# Documents with at least this many segments are validated in worker
+# processes; below it, process start-up costs more than validation itself
+PARALLEL_SEGMENT_THRESHOLD = 5000
+
+
+def _validate_counts(job):
+    """Validate a parsed document against one retailer (process-pool worker)."""
+    parsed_edi, doc_type, retailer = job
+    result = ValidationEngine().validate(parsed_edi, _get_rules(doc_type, retailer), retailer)
+    return result.error_count(), result.warning_count()
+
+
+def _compare_retailers(parsed_edi, doc_type):
+    """Return (errors, warnings) for each comparison retailer, in order."""
+    jobs = [(parsed_edi, doc_type, retailer) for retailer in COMPARISON_RETAILERS]
+
+    if parsed_edi['statistics']['total_segments'] < PARALLEL_SEGMENT_THRESHOLD:
+        return [_validate_counts(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+        return list(pool.map(_validate_counts, jobs))
+
+
+def print_lines(lines):
+    """Print a batch of lines with a single write to stdout."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
 def print_header(text):
     """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {text}")
-    print("=" * 70)
+    print(f"\n{_BAR}\n  {text}\n{_BAR}")
 
 
 def simulate_file_upload_workflow():
@@ -54,8 +137,7 @@ def simulate_file_upload_workflow():
 
     # Step 3: Load rules
     print(f"\n  ⚙️  Loading validation rules...")
-    loader = RuleLoader()
-    rules = loader.load_rules(doc_type, retailer)
+    rules = _get_rules(doc_type, retailer)
     print(f"    ✓ Loaded rules for {doc_type} + {retailer.upper()}")
 
     # Step 4: Validate
@@ -82,9 +164,7 @@ def simulate_file_upload_workflow():
     # Step 7: Show dashboard (Tab 1)
     print(f"\n  Dashboard Preview:")
     dashboard = generator.generate_dashboard()
-    dashboard_lines = dashboard.split('\n')[:15]
-    for line in dashboard_lines:
-        print(f"    {line}")
+    print_lines("    " + line.rstrip("\n") for line in islice(StringIO(dashboard), 15))
     print(f"    ... (dashboard continues)")
 
     # Step 8: Download reports (Tab 4)
@@ -114,11 +194,10 @@ def simulate_paste_text_workflow():
 
     # Step 2: User pastes EDI text (read from sample for demo)
     print(f"\n  📋 Reading pasted EDI content...")
-    with open("samples/edi_856_valid.txt", 'r') as f:
-        edi_text = f.read()
-
-    lines = edi_text.split('\n')
-    print(f"    ✓ {len(lines)} lines pasted")
+    data = Path("samples/edi_856_valid.txt").read_bytes()
+    line_count = data.count(b'\n') + 1
+    edi_text = data.decode('utf-8')
+    print(f"    ✓ {line_count} lines pasted")
 
     # Step 3: Parse text (not file)
     print(f"\n  ⚙️  Parsing EDI text...")
@@ -128,8 +207,7 @@ def simulate_paste_text_workflow():
 
     # Step 4: Load rules
     print(f"\n  ⚙️  Loading validation rules...")
-    loader = RuleLoader()
-    rules = loader.load_rules(doc_type, retailer)
+    rules = _get_rules(doc_type, retailer)
     print(f"    ✓ Loaded rules for document type {doc_type}")
 
     # Step 5: Validate
@@ -155,8 +233,10 @@ def simulate_paste_text_workflow():
     if result.total_issues() > 0:
         print(f"\n  📋 Issues List (filtering by ERROR):")
         errors = result.get_errors()
-        for idx, error in enumerate(errors[:3], 1):
-            print(f"    {idx}. [Line {error.line_number}] {error.message}")
+        print_lines(
+            f"    {idx}. [Line {error.line_number}] {error.message}"
+            for idx, error in enumerate(errors[:3], 1)
+        )
         if len(errors) > 3:
             print(f"    ... ({len(errors) - 3} more errors)")
     else:
@@ -186,26 +266,25 @@ def simulate_sample_file_workflow():
     print(f"\n  ✅ Loaded: 850 - Invalid PO")
 
     try:
-        with open(sample_file, 'r') as f:
-            edi_text = f.read()
+        data = Path(sample_file).read_bytes()
     except FileNotFoundError:
         print(f"  ❌ Sample file not found: {sample_file}")
         return None
 
+    line_count = data.count(b'\n') + 1
+    edi_text = data.decode('utf-8')
+
     # Step 3: Preview (expandable section in UI)
     print(f"\n  📝 Preview EDI Content:")
-    preview_lines = edi_text.split('\n')[:5]
-    for line in preview_lines:
-        print(f"    {line}")
-    print(f"    ... ({len(edi_text.split(chr(10))) - 5} more lines)")
+    print_lines(f"    {line}" for line in _head_lines(data, 5))
+    print(f"    ... ({line_count - 5} more lines)")
 
     # Step 4: Parse, load rules, validate
     print(f"\n  ⚙️  Running validation...")
     parser = EDIParser()
     parsed_edi = parser.parse_text(edi_text)
 
-    loader = RuleLoader()
-    rules = loader.load_rules(doc_type, retailer)
+    rules = _get_rules(doc_type, retailer)
 
     engine = ValidationEngine()
     result = engine.validate(parsed_edi, rules, retailer)
@@ -227,9 +306,7 @@ def simulate_sample_file_workflow():
     # Step 6: Show detailed report (Tab 2)
     print(f"\n  📝 Detailed Report Preview:")
     text_report = generator.generate_text_report()
-    report_lines = text_report.split('\n')[:25]
-    for line in report_lines:
-        print(f"    {line}")
+    print_lines("    " + line.rstrip("\n") for line in islice(StringIO(text_report), 25))
     print(f"    ... (report continues)")
 
     return result
@@ -250,12 +327,13 @@ def simulate_download_all_formats():
 
     # Save all formats (like clicking all download buttons)
     print(f"\n  💾 Saving all report formats...")
-    files = generator.save_all_formats("output", "demo_ui_validation")
+    files = generator.save_all_formats("output", "demo_ui_validation", include_sizes=True)
 
     print(f"\n  ✓ Reports saved:")
-    for format_name, file_path in files.items():
-        file_size = Path(file_path).stat().st_size
-        print(f"    {format_name:12} → {file_path} ({file_size:,} bytes)")
+    print_lines(
+        f"    {format_name:12} → {file_path} ({file_size:,} bytes)"
+        for format_name, (file_path, file_size) in files.items()
+    )
 
     return files
 
@@ -272,23 +350,15 @@ def simulate_retailer_comparison():
     print(f"\n  Validating {sample_file} with different retailer rules:")
     print()
 
-    engine = ValidationEngine()
-
-    # Base rules
-    result_base = engine.validate_file(sample_file, doc_type)
-    print(f"    None (Base):  {result_base.error_count()} errors, {result_base.warning_count()} warnings")
-
-    # Walmart
-    result_walmart = engine.validate_file(sample_file, doc_type, "walmart")
-    print(f"    Walmart:      {result_walmart.error_count()} errors, {result_walmart.warning_count()} warnings")
-
-    # Amazon
-    result_amazon = engine.validate_file(sample_file, doc_type, "amazon")
-    print(f"    Amazon:       {result_amazon.error_count()} errors, {result_amazon.warning_count()} warnings")
+    # Parse once and validate the same document against each ruleset
+    parsed_edi = _parse_once(sample_file)
+    counts = _compare_retailers(parsed_edi, doc_type)
 
-    # Target
-    result_target = engine.validate_file(sample_file, doc_type, "target")
-    print(f"    Target:       {result_target.error_count()} errors, {result_target.warning_count()} warnings")
+    labels = ("None (Base):", "Walmart:", "Amazon:", "Target:")
+    print_lines(
+        f"    {label:14}{errors} errors, {warnings} warnings"
+        for label, (errors, warnings) in zip(labels, counts)
+    )
 
     print(f"\n  📊 Observation:")
     print(f"    Retailer-specific rules add stricter validation requirements")
@@ -297,9 +367,7 @@ def simulate_retailer_comparison():
 
 def main():
     """Run all UI workflow demonstrations."""
-    print("\n" + "╔" + "═" * 68 + "╗")
-    print("║" + " " * 20 + "UI WORKFLOW DEMONSTRATION" + " " * 23 + "║")
-    print("╚" + "═" * 68 + "╝")
+    print(_BANNER)
 
     print("\n  This demonstrates the exact workflow executed by the Streamlit UI.")
     print("  Each scenario simulates user interactions with the web interface.")
@@ -12,20 +12,63 @@ The parser:
 - Produces clean JSON output
 """
 
+import codecs
 import json
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+from config.settings import SEGMENT_TERMINATOR
 from .segment_utils import (
     normalize_edi_text,
-    split_segments,
-    split_elements,
-    get_segment_id,
-    get_element_value,
-    extract_control_numbers
+    iter_segments,
+    tokenize_segments,
+    has_complete_envelope
 )
 
 
+def _element(elements: List[str], position: int) -> str:
+    """Return the stripped element at position, or '' if it is missing."""
+    return elements[position].strip() if position < len(elements) else ''
+
+
+def _fill_isa(metadata: Dict, elements: List[str]) -> None:
+    """Record interchange-level metadata from an ISA segment."""
+    metadata['sender_id'] = _element(elements, 6)
+    metadata['receiver_id'] = _element(elements, 8)
+    metadata['interchange_date'] = _element(elements, 9)
+    metadata['interchange_time'] = _element(elements, 10)
+    metadata['version'] = _element(elements, 12)
+    # ISA13 is interchange control number
+    metadata['control_numbers']['interchange_control'] = _element(elements, 13)
+
+
+def _fill_gs(metadata: Dict, elements: List[str]) -> None:
+    """Record functional group info from a GS segment."""
+    metadata['functional_group'] = _element(elements, 1)
+    # GS06 is group control number
+    metadata['control_numbers']['group_control'] = _element(elements, 6)
+
+
+def _fill_st(metadata: Dict, elements: List[str]) -> None:
+    """Record the transaction set type from an ST segment."""
+    metadata['doc_type'] = _element(elements, 1)
+    # ST02 is transaction set control number
+    metadata['control_numbers']['transaction_control'] = _element(elements, 2)
+
+
+# Segments that carry document metadata, mapped to the handler that records it
+_ENVELOPE_HANDLERS = {
+    'ISA': _fill_isa,
+    'GS': _fill_gs,
+    'ST': _fill_st,
+}
+
+
 class EDIParser:
     """
     Lightweight EDI parser that converts X12 EDI documents to structured JSON.
@@ -44,11 +87,19 @@ class EDIParser:
         '850'
     """
 
-    def __init__(self):
-        """Initialize the EDI parser."""
+    def __init__(self, include_raw: bool = True):
+        """
+        Initialize the EDI parser.
+
+        Args:
+            include_raw: Keep each segment's original string under 'raw'.
+                Pass False for large documents to avoid holding a second
+                copy of every segment alongside its elements.
+        """
+        self.include_raw = include_raw
         self.raw_text = ""
-        self.segments = []
         self.parsed_data = {}
+        self._by_id = {}
 
     def parse_file(self, file_path: str) -> Dict:
         """
@@ -72,11 +123,154 @@ class EDIParser:
         with open(path, 'r', encoding='utf-8') as f:
             raw_text = f.read()
 
-        if not raw_text.strip():
+        # isspace() scans without allocating a stripped copy of the file
+        if not raw_text or raw_text.isspace():
             raise ValueError(f"EDI file is empty: {file_path}")
 
         return self.parse_text(raw_text)
 
+    def parse_file_streaming(self, file_path: str, chunk_size: int = 1 << 20) -> Dict:
+        """
+        Parse an EDI file from disk a chunk at a time.
+
+        Produces the same structure as parse_file() without holding the whole
+        file text in memory; raw_text is left empty.
+
+        Args:
+            file_path: Path to the EDI file
+            chunk_size: Number of bytes to read per chunk
+
+        Returns:
+            Parsed EDI document as dictionary
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If no segments are found
+        """
+        path = Path(file_path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"EDI file not found: {file_path}")
+
+        with open(path, 'rb') as f:
+            return self.parse_stream(f, chunk_size)
+
+    def parse_stream(self, stream: BinaryIO, chunk_size: int = 1 << 20) -> Dict:
+        """
+        Parse EDI data from a binary file-like object a chunk at a time.
+
+        Reads from the stream's current position. Like parse_file_streaming(),
+        the decoded text is never held in full and raw_text is left empty.
+
+        Args:
+            stream: Readable binary stream of UTF-8 EDI data (e.g., an upload)
+            chunk_size: Number of bytes to read per chunk
+
+        Returns:
+            Parsed EDI document as dictionary
+
+        Raises:
+            ValueError: If no segments are found
+        """
+        self.raw_text = ""
+        self.parsed_data = self._build_parsed_structure(
+            self._stream_segments(stream, chunk_size)
+        )
+
+        return self.parsed_data
+
+    def iter_parsed_segments(
+        self, stream: BinaryIO, chunk_size: int = 1 << 20, metadata: Optional[Dict] = None
+    ) -> Iterator[Dict]:
+        """
+        Yield parsed segments one at a time from a binary stream.
+
+        Unlike parse_stream(), no segment list, index or statistics are
+        built, so memory use is bounded by what the consumer keeps (see
+        ValidationEngine.validate_stream()). parsed_data and
+        get_segments_by_id() are not updated.
+
+        Args:
+            stream: Readable binary stream of UTF-8 EDI data
+            chunk_size: Number of bytes to read per chunk
+            metadata: Optional dictionary filled in with document metadata
+                (doc type, control numbers, ...) as ISA/GS/ST segments pass
+
+        Yields:
+            Segment dictionaries in the same format as parse_file()
+
+        Raises:
+            ValueError: If no segments are found (once the stream is exhausted)
+        """
+        if metadata is None:
+            metadata = {}
+        metadata.update(self._new_metadata())
+
+        segment_dict = None
+        for segment_dict in self._iter_segment_dicts(
+            self._stream_segments(stream, chunk_size), metadata
+        ):
+            yield segment_dict
+
+        if segment_dict is None:
+            raise ValueError("No segments found in EDI text")
+
+    @staticmethod
+    def _stream_segments(stream: BinaryIO, chunk_size: int) -> Iterator[str]:
+        """
+        Yield normalized segments from a binary stream read in fixed-size chunks.
+
+        Text after the last segment terminator in a chunk is carried over to
+        the next one, so segments split across chunk boundaries stay intact.
+
+        Args:
+            stream: Readable binary stream
+            chunk_size: Number of bytes to read per chunk
+
+        Yields:
+            Segment strings (without terminators)
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        tail = ""
+
+        while True:
+            chunk = stream.read(chunk_size)
+            text = tail + decoder.decode(chunk, final=not chunk)
+
+            if not chunk:
+                # End of stream: whatever is left is the final segment
+                complete, tail = text, ""
+            else:
+                cut = text.rfind(SEGMENT_TERMINATOR) + 1
+                complete, tail = text[:cut], text[cut:]
+
+            if complete:
+                yield from iter_segments(normalize_edi_text(complete))
+
+            if not chunk:
+                break
+
+    def parse_bytes(self, data: bytes) -> Dict:
+        """
+        Parse EDI data already held in memory as bytes (e.g., an upload).
+
+        X12 content is ASCII, so the single decode is a fast copy; segments
+        are then split by the same C-level str routines as parse_text().
+        Splitting the bytes first would only trade that one decode for a
+        decode per element, since parsed elements are strings.
+
+        Args:
+            data: UTF-8 encoded EDI document
+
+        Returns:
+            Parsed EDI document as dictionary
+
+        Raises:
+            ValueError: If the data is empty or invalid
+            UnicodeDecodeError: If the data is not valid UTF-8
+        """
+        return self.parse_text(data.decode('utf-8'))
+
     def parse_text(self, edi_text: str) -> Dict:
         """
         Parse EDI text directly.
@@ -95,36 +289,34 @@ class EDIParser:
         Raises:
             ValueError: If EDI text is invalid
         """
-        if not edi_text or not edi_text.strip():
+        if not edi_text or edi_text.isspace():
             raise ValueError("EDI text is empty")
 
         # Store raw text
         self.raw_text = edi_text
 
-        # Normalize and split into segments
+        # Normalize once; segments are parsed as they are split off the text
         normalized_text = normalize_edi_text(edi_text)
-        self.segments = split_segments(normalized_text)
-
-        if not self.segments:
-            raise ValueError("No segments found in EDI text")
 
         # Build structured data
-        self.parsed_data = self._build_parsed_structure()
+        self.parsed_data = self._build_parsed_structure(iter_segments(normalized_text))
 
         return self.parsed_data
 
-    def _build_parsed_structure(self) -> Dict:
+    def _build_parsed_structure(self, segments: Iterable[str]) -> Dict:
         """
         Build the complete parsed data structure.
 
+        Args:
+            segments: Segment strings, consumed in a single pass
+
         Returns:
             Dictionary with metadata, segments, and statistics
         """
-        # Extract metadata from envelope segments
-        metadata = self._extract_metadata()
-
-        # Parse all segments with line numbers
-        parsed_segments = self._parse_all_segments()
+        # Parse all segments with line numbers, picking up envelope
+        # metadata in the same pass
+        metadata = self._new_metadata()
+        parsed_segments = self._parse_all_segments(segments, metadata)
 
         # Calculate statistics
         statistics = self._calculate_statistics(parsed_segments)
@@ -135,76 +327,96 @@ class EDIParser:
             'statistics': statistics
         }
 
-    def _extract_metadata(self) -> Dict:
+    @staticmethod
+    def _new_metadata() -> Dict:
         """
-        Extract metadata from ISA, GS, and ST segments.
+        Create an empty metadata dictionary.
 
         Returns:
-            Dictionary with document metadata
+            Dictionary with blank document metadata fields
         """
-        metadata = {
+        return {
             'doc_type': '',
             'version': '',
             'sender_id': '',
             'receiver_id': '',
             'interchange_date': '',
             'interchange_time': '',
-            'control_numbers': {},
+            'control_numbers': {
+                'interchange_control': '',
+                'group_control': '',
+                'transaction_control': ''
+            },
             'functional_group': ''
         }
 
-        for segment_str in self.segments:
-            seg_id = get_segment_id(segment_str)
+    def _parse_all_segments(self, segments: Iterable[str], metadata: Dict) -> List[Dict]:
+        """
+        Parse all segments into structured dictionaries with line tracking.
+
+        Args:
+            segments: Segment strings to parse
+            metadata: Metadata dictionary filled in from envelope segments
+
+        Returns:
+            List of parsed segment dictionaries
 
-            if seg_id == 'ISA':
-                # ISA segment contains interchange-level metadata
-                metadata['sender_id'] = get_element_value(segment_str, 6).strip()
-                metadata['receiver_id'] = get_element_value(segment_str, 8).strip()
-                metadata['interchange_date'] = get_element_value(segment_str, 9)
-                metadata['interchange_time'] = get_element_value(segment_str, 10)
-                metadata['version'] = get_element_value(segment_str, 12)
+        Raises:
+            ValueError: If no segments were found
+        """
+        parsed_segments = []
+        append_segment = parsed_segments.append
 
-            elif seg_id == 'GS':
-                # GS segment contains functional group info
-                metadata['functional_group'] = get_element_value(segment_str, 1)
+        # Index segments by ID as they are parsed for O(1) lookups
+        by_id = {}
 
-            elif seg_id == 'ST':
-                # ST segment contains transaction set type
-                metadata['doc_type'] = get_element_value(segment_str, 1)
+        for segment_dict in self._iter_segment_dicts(segments, metadata):
+            append_segment(segment_dict)
+            by_id.setdefault(segment_dict['segment_id'], []).append(segment_dict)
 
-        # Extract control numbers
-        metadata['control_numbers'] = extract_control_numbers(self.segments)
+        # Checked here, after the single pass, so a failed parse leaves the
+        # previous document's index in place
+        if not parsed_segments:
+            raise ValueError("No segments found in EDI text")
 
-        return metadata
+        self._by_id = by_id
 
-    def _parse_all_segments(self) -> List[Dict]:
+        return parsed_segments
+
+    def _iter_segment_dicts(self, segments: Iterable[str], metadata: Dict) -> Iterator[Dict]:
         """
-        Parse all segments into structured dictionaries with line tracking.
+        Build a structured dictionary for each segment, tracking line numbers.
 
-        Returns:
-            List of parsed segment dictionaries
+        Shared by whole-document parsing and iter_parsed_segments().
+
+        Args:
+            segments: Segment strings to parse
+            metadata: Metadata dictionary filled in from envelope segments
+
+        Yields:
+            Parsed segment dictionaries, in document order
         """
-        parsed_segments = []
-        line_number = 1
+        get_handler = _ENVELOPE_HANDLERS.get
+        include_raw = self.include_raw
 
-        for segment_str in self.segments:
-            elements = split_elements(segment_str)
+        for line_number, (segment_str, elements) in enumerate(tokenize_segments(segments), 1):
+            segment_id = elements[0]
 
-            if not elements:
-                continue
+            # One hash probe; only ISA/GS/ST carry metadata
+            fill_metadata = get_handler(segment_id)
+            if fill_metadata is not None:
+                fill_metadata(metadata, elements)
 
             segment_dict = {
                 'line': line_number,
-                'segment_id': elements[0],
+                'segment_id': segment_id,
                 'elements': elements,
-                'element_count': len(elements),
-                'raw': segment_str
+                'element_count': len(elements)
             }
+            if include_raw:
+                segment_dict['raw'] = segment_str
 
-            parsed_segments.append(segment_dict)
-            line_number += 1
-
-        return parsed_segments
+            yield segment_dict
 
     def _calculate_statistics(self, segments: List[Dict]) -> Dict:
         """
@@ -216,34 +428,18 @@ class EDIParser:
         Returns:
             Dictionary with document statistics
         """
-        # Count segments by type
-        segment_counts = {}
-        for seg in segments:
-            seg_id = seg['segment_id']
-            segment_counts[seg_id] = segment_counts.get(seg_id, 0) + 1
+        # Count segments by type from the ID index built during parsing,
+        # sorted by segment ID once here so consumers can display it as-is
+        segment_counts = {
+            seg_id: len(self._by_id[seg_id]) for seg_id in sorted(self._by_id)
+        }
 
         return {
             'total_segments': len(segments),
             'segment_counts': segment_counts,
-            'has_envelope': self._has_complete_envelope(segments)
+            'has_envelope': has_complete_envelope(segment_counts)
         }
 
-    def _has_complete_envelope(self, segments: List[Dict]) -> bool:
-        """
-        Check if document has complete ISA/GS/ST envelope structure.
-
-        Args:
-            segments: List of parsed segments
-
-        Returns:
-            True if all envelope segments are present
-        """
-        segment_ids = {seg['segment_id'] for seg in segments}
-
-        required_envelope = {'ISA', 'GS', 'ST', 'SE', 'GE', 'IEA'}
-
-        return required_envelope.issubset(segment_ids)
-
     def get_segments_by_id(self, segment_id: str) -> List[Dict]:
         """
         Get all segments with a specific ID.
@@ -257,10 +453,7 @@ class EDIParser:
         if not self.parsed_data:
             return []
 
-        return [
-            seg for seg in self.parsed_data.get('segments', [])
-            if seg['segment_id'] == segment_id
-        ]
+        return list(self._by_id.get(segment_id, ()))
 
     def get_element_value(self, segment_id: str, element_position: int,
                          occurrence: int = 0, default: str = "") -> str:
@@ -276,7 +469,8 @@ class EDIParser:
         Returns:
             Element value or default
         """
-        segments = self.get_segments_by_id(segment_id)
+        # Read the ID index directly; no need for get_segments_by_id()'s copy
+        segments = self._by_id.get(segment_id, ())
 
         if occurrence < len(segments):
             segment = segments[occurrence]
@@ -298,8 +492,31 @@ class EDIParser:
         Returns:
             JSON string representation
         """
+        # orjson only supports 2-space indentation
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.parsed_data, option=orjson.OPT_INDENT_2).decode('utf-8')
+
         return json.dumps(self.parsed_data, indent=indent)
 
+    def to_json_bytes(self, indent: int = 2) -> bytes:
+        """
+        Export parsed data as UTF-8 encoded JSON.
+
+        Skips the decode/encode round trip when the result is headed for a
+        file or socket anyway.
+
+        Args:
+            indent: Number of spaces for indentation (None for compact)
+
+        Returns:
+            UTF-8 JSON bytes
+        """
+        # orjson only supports 2-space indentation
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.parsed_data, option=orjson.OPT_INDENT_2)
+
+        return json.dumps(self.parsed_data, indent=indent).encode('utf-8')
+
     def to_dict(self) -> Dict:
         """
         Get parsed data as dictionary.
@@ -8,7 +8,10 @@ This module provides low-level utilities for:
 - Normalizing whitespace and delimiters
 """
 
-from typing import List, Dict, Optional
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from config.settings import SEGMENT_TERMINATOR, ELEMENT_SEPARATOR, SUBELEMENT_SEPARATOR
 
 
@@ -22,16 +25,61 @@ def normalize_edi_text(raw_text: str) -> str:
     Returns:
         Normalized EDI text with consistent formatting
     """
-    # Remove leading/trailing whitespace
-    normalized = raw_text.strip()
+    # Fast path: single-line input (the usual "~"-only layout) only needs trimming
+    if '\n' not in raw_text and '\r' not in raw_text:
+        return raw_text.strip()
 
     # Ensure consistent line endings (convert all to \n)
-    normalized = normalized.replace('\r\n', '\n').replace('\r', '\n')
+    if '\r' in raw_text:
+        raw_text = raw_text.replace('\r\n', '\n').replace('\r', '\n')
 
-    # Remove extra blank lines but preserve segment structure
-    lines = [line.strip() for line in normalized.split('\n') if line.strip()]
+    # Strip every line and drop blank ones; map/filter keep the per-line
+    # work in C, which benchmarks well ahead of a regex substitution
+    return '\n'.join(filter(None, map(str.strip, raw_text.split('\n'))))
 
-    return '\n'.join(lines)
+
+# Characters of text split per step in iter_segments
+_SCAN_WINDOW = 1 << 16
+
+
+def iter_segments(edi_text: str, segment_terminator: str = SEGMENT_TERMINATOR) -> Iterator[str]:
+    """
+    Yield EDI segments one at a time without building the full list.
+
+    Args:
+        edi_text: Normalized EDI text (see normalize_edi_text)
+        segment_terminator: Character that terminates segments (default: ~)
+
+    Yields:
+        Segment strings (without terminators), stripped, skipping empty ones
+    """
+    if not segment_terminator:
+        raise ValueError("Segment terminator must not be empty")
+
+    start = 0
+    length = len(edi_text)
+    # rfind could land inside an overlapping multi-character terminator, so
+    # only single-character terminators (the X12 norm) are windowed
+    window = _SCAN_WINDOW if len(segment_terminator) == 1 else length
+
+    # Cut the text into windows ending on a terminator and let str.split scan
+    # each window in C; only one window's segment list is alive at a time
+    while start < length:
+        window_end = start + window
+        if window_end >= length:
+            cut = length
+        else:
+            cut = edi_text.rfind(segment_terminator, start, window_end)
+            if cut < 0:
+                # One segment longer than the window; extend to its end
+                cut = edi_text.find(segment_terminator, window_end)
+                if cut < 0:
+                    cut = length
+
+        block = edi_text[start:cut].split(segment_terminator)
+        yield from filter(None, map(str.strip, block))
+
+        start = cut + len(segment_terminator)
 
 
 def split_segments(edi_text: str, segment_terminator: str = SEGMENT_TERMINATOR) -> List[str]:
@@ -39,22 +87,13 @@ def split_segments(edi_text: str, segment_terminator: str = SEGMENT_TERMINATOR)
     Split EDI text into individual segments.
 
     Args:
-        edi_text: Normalized EDI text
+        edi_text: Normalized EDI text (see normalize_edi_text)
         segment_terminator: Character that terminates segments (default: ~)
 
     Returns:
         List of segment strings (without terminators)
     """
-    # Normalize first
-    normalized = normalize_edi_text(edi_text)
-
-    # Split by segment terminator
-    segments = normalized.split(segment_terminator)
-
-    # Filter out empty segments and strip whitespace
-    segments = [seg.strip() for seg in segments if seg.strip()]
-
-    return segments
+    return list(iter_segments(edi_text, segment_terminator))
 
 
 def split_elements(segment: str, element_separator: str = ELEMENT_SEPARATOR) -> List[str]:
@@ -79,6 +118,56 @@ def split_elements(segment: str, element_separator: str = ELEMENT_SEPARATOR) ->
     return elements
 
 
+# Segment IDs and qualifiers ("BY", "EA", "PO1") repeat across every document
+_SHORT_CODE_PATTERN = re.compile(r'[A-Z0-9]{1,4}')
+
+
+@lru_cache(maxsize=2048)
+def intern_short_code(value: str) -> str:
+    """
+    Intern short uppercase codes so repeated occurrences share one string.
+
+    Args:
+        value: Element or segment ID string
+
+    Returns:
+        The interned string for short alphanumeric codes, otherwise the value unchanged
+
+    Example:
+        >>> intern_short_code("PO1") is intern_short_code("".join(["PO", "1"]))
+        True
+    """
+    if _SHORT_CODE_PATTERN.fullmatch(value):
+        return sys.intern(value)
+    return value
+
+
+def tokenize_segments(
+    segments: Iterable[str],
+    element_separator: str = ELEMENT_SEPARATOR
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Split each segment into elements, interning short codes along the way.
+
+    This is the parser's hot loop, so lookups are bound to locals once.
+
+    Args:
+        segments: Segment strings (e.g. from iter_segments)
+        element_separator: Character that separates elements (default: *)
+
+    Yields:
+        (segment, elements) pairs; elements[0] is the segment ID
+    """
+    intern_code = intern_short_code
+
+    for segment in segments:
+        # Share one string per repeated short code (IDs, qualifiers, units)
+        yield segment, [
+            intern_code(element) if len(element) <= 4 else element
+            for element in segment.split(element_separator)
+        ]
+
+
 def split_subelements(element: str, subelement_separator: str = SUBELEMENT_SEPARATOR) -> List[str]:
     """
     Split an element into sub-elements (composite elements).
@@ -115,8 +204,27 @@ def get_segment_id(segment: str) -> str:
         >>> get_segment_id("BEG*00*NE*PO123456")
         'BEG'
     """
-    elements = split_elements(segment)
-    return elements[0] if elements else ""
+    # Only the text before the first separator is needed; skip the full split
+    return segment.partition(ELEMENT_SEPARATOR)[0]
+
+
+@lru_cache(maxsize=256)
+def _stripped_elements(segment: str) -> tuple:
+    """
+    Split a segment and strip each element, memoized for repeated lookups.
+
+    Callers often read several positions of the same segment in a row
+    (e.g. ISA06, ISA08, ISA13); a tuple keeps the cached result immutable.
+
+    Args:
+        segment: EDI segment string
+
+    Returns:
+        Tuple of stripped element strings
+    """
+    # str.strip hands back the same object when there is nothing to trim,
+    # so stripping clean elements allocates nothing
+    return tuple(map(str.strip, segment.split(ELEMENT_SEPARATOR)))
 
 
 def get_element_value(segment: str, position: int, default: str = "") -> str:
@@ -135,10 +243,14 @@ def get_element_value(segment: str, position: int, default: str = "") -> str:
         >>> get_element_value("BEG*00*NE*PO123456", 3)
         'PO123456'
     """
-    elements = split_elements(segment)
+    if position == 0:
+        value = get_segment_id(segment).strip()
+        return value if value else default
+
+    elements = _stripped_elements(segment)
 
     if position < len(elements):
-        value = elements[position].strip()
+        value = elements[position]
         return value if value else default
 
     return default
@@ -163,8 +275,11 @@ def parse_segment_to_dict(segment: str) -> Dict[str, any]:
     """
     elements = split_elements(segment)
 
+    # Segment IDs repeat across a document; share one string per ID
+    elements[0] = sys.intern(elements[0])
+
     return {
-        'segment_id': elements[0] if elements else "",
+        'segment_id': elements[0],
         'elements': elements
     }
 
@@ -180,11 +295,7 @@ def count_segment_occurrences(segments: List[str], segment_id: str) -> int:
     Returns:
         Count of occurrences
     """
-    count = 0
-    for segment in segments:
-        if get_segment_id(segment) == segment_id:
-            count += 1
-    return count
+    return sum(1 for segment in segments if get_segment_id(segment) == segment_id)
 
 
 def find_segments_by_id(segments: List[str], segment_id: str) -> List[Dict[str, any]]:
@@ -237,3 +348,20 @@ def extract_control_numbers(segments: List[str]) -> Dict[str, str]:
             control_numbers['transaction_control'] = get_element_value(segment, 2)
 
     return control_numbers
+
+
+# Segments that must all be present for a complete interchange envelope
+ENVELOPE_SEGMENTS = frozenset({'ISA', 'GS', 'ST', 'SE', 'GE', 'IEA'})
+
+
+def has_complete_envelope(segment_counts: Dict[str, int]) -> bool:
+    """
+    Check if a document has the complete ISA/GS/ST envelope structure.
+
+    Args:
+        segment_counts: Segment counts (or any collection) keyed by segment ID
+
+    Returns:
+        True if all envelope segments are present
+    """
+    return ENVELOPE_SEGMENTS.issubset(segment_counts)
@@ -11,9 +11,98 @@ Provides formatters for different output types:
 import json
 import csv
 from io import StringIO
-from typing import Dict, List
+from typing import Dict
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+# Rules and fixed text blocks, built once at import. Each block spans several
+# report lines and is appended as one entry before the final "\n".join
+_SEP_EQ = "=" * 70
+_SEP_DASH = "-" * 70
+_TEXT_HEADER = f"{_SEP_EQ}\nEDI COMPLIANCE VALIDATION REPORT\n{_SEP_EQ}\n"
+_TEXT_NO_ISSUES = "NO ISSUES FOUND\n\n✓ All validation rules passed successfully.\n"
+_TEXT_FOOTER = f"{_SEP_EQ}\nEND OF REPORT\n{_SEP_EQ}"
+
+# Detailed-issue sections in report order: (severity, section title)
+_SEVERITY_SECTIONS = (
+    ("ERROR", "ERRORS"),
+    ("WARNING", "WARNINGS"),
+    ("INFO", "INFORMATIONAL"),
+)
+
+# CSV column headings, in the order rows are written by CSVFormatter
+_CSV_HEADER = (
+    'Severity',
+    'Rule ID',
+    'Segment',
+    'Line Number',
+    'Element Position',
+    'Message',
+    'Expected Value',
+    'Actual Value'
+)
+
+# Dashboard sections as str.format templates; widths live here in one place
+_BOX_TOP = "┌─────────────────────────────────────────────────────────────────┐"
+_BOX_BOTTOM = "└─────────────────────────────────────────────────────────────────┘"
+_DASHBOARD_HEADER = (
+    "╔" + "═" * 68 + "╗\n"
+    "║" + " " * 20 + "VALIDATION DASHBOARD" + " " * 28 + "║\n"
+    "╚" + "═" * 68 + "╝\n"
+)
+_DASHBOARD_STATUS = {
+    True: (
+        f"{_BOX_TOP}\n"
+        "│ STATUS: ✓ COMPLIANT                                             │\n"
+        f"{_BOX_BOTTOM}\n"
+    ),
+    False: (
+        f"{_BOX_TOP}\n"
+        "│ STATUS: ✗ NON-COMPLIANT                                          │\n"
+        f"{_BOX_BOTTOM}\n"
+    ),
+}
+_DASHBOARD_QUICK_STATS = (
+    "┌─── QUICK STATS ─────────────────────────────────────────────────┐\n"
+    "│  Total Issues:  {total:3}                                            │\n"
+    "│  Errors:        {errors:3}                                            │\n"
+    "│  Warnings:      {warnings:3}                                            │\n"
+    f"{_BOX_BOTTOM}\n"
+)
+_DASHBOARD_DOCUMENT_INFO = (
+    "┌─── DOCUMENT INFO ───────────────────────────────────────────────┐\n"
+    "│  Type:          {doc_type:10}                                 │\n"
+    "│  Sender:        {sender:20}                   │\n"
+    "│  Receiver:      {receiver:20}                   │\n"
+    f"{_BOX_BOTTOM}\n"
+)
+_DASHBOARD_TOP_SEGMENTS = "┌─── TOP SEGMENTS WITH ISSUES ────────────────────────────────────┐"
+_DASHBOARD_SEGMENT_ROW = "│  {seg_id:8} │{bar:30}│ {count:3}    │"
+_DASHBOARD_VALIDATION_TIME = (
+    "┌─── VALIDATION INFO ─────────────────────────────────────────────┐\n"
+    "│  Time:          {seconds:6.3f}s                                 │"
+)
+_DASHBOARD_RETAILER = "│  Retailer:      {retailer:20}                   │"
+_DASHBOARD_ACTIONS = (
+    "┌─── RECOMMENDED ACTIONS ─────────────────────────────────────────┐\n"
+    "│  1. Review ERROR-level violations (blocking issues)            │\n"
+    "│  2. Address mandatory segment/element requirements             │\n"
+    "│  3. Verify retailer-specific formatting rules                  │\n"
+    "│  4. Re-validate after corrections                              │\n"
+    f"{_BOX_BOTTOM}"
+)
+_DASHBOARD_NEXT_STEPS = (
+    "┌─── NEXT STEPS ──────────────────────────────────────────────────┐\n"
+    "│  ✓ Document passed all validation rules                        │\n"
+    "│  ✓ Ready for transmission                                      │\n"
+    f"{_BOX_BOTTOM}"
+)
+
 
 class TextFormatter:
     """
@@ -37,28 +126,28 @@ class TextFormatter:
         lines = []
 
         # Header
-        lines.append("=" * 70)
-        lines.append("EDI COMPLIANCE VALIDATION REPORT")
-        lines.append("=" * 70)
-        lines.append("")
+        lines.append(_TEXT_HEADER)
 
         # Document Information
         doc_info = summary['document_info']
-        lines.append("DOCUMENT INFORMATION")
-        lines.append("-" * 70)
-        lines.append(f"  Document Type:     {doc_info.get('doc_type', 'N/A')}")
-        lines.append(f"  Sender:            {doc_info.get('sender', 'N/A')}")
-        lines.append(f"  Receiver:          {doc_info.get('receiver', 'N/A')}")
-        lines.append(f"  Control Number:    {doc_info.get('control_number', 'N/A')}")
-        lines.append("")
+        lines.append(
+            "DOCUMENT INFORMATION\n"
+            f"{_SEP_DASH}\n"
+            f"  Document Type:     {doc_info.get('doc_type', 'N/A')}\n"
+            f"  Sender:            {doc_info.get('sender', 'N/A')}\n"
+            f"  Receiver:          {doc_info.get('receiver', 'N/A')}\n"
+            f"  Control Number:    {doc_info.get('control_number', 'N/A')}\n"
+        )
 
         # Validation Information
         val_info = summary['validation_info']
-        lines.append("VALIDATION INFORMATION")
-        lines.append("-" * 70)
-        lines.append(f"  Timestamp:         {val_info.get('timestamp', 'N/A')}")
-        lines.append(f"  Validation Time:   {val_info.get('validation_time_seconds', 0):.3f}s")
-        lines.append(f"  Rules Applied:     {val_info.get('rules_applied', 'N/A')}")
+        lines.append(
+            "VALIDATION INFORMATION\n"
+            f"{_SEP_DASH}\n"
+            f"  Timestamp:         {val_info.get('timestamp', 'N/A')}\n"
+            f"  Validation Time:   {val_info.get('validation_time_seconds', 0):.3f}s\n"
+            f"  Rules Applied:     {val_info.get('rules_applied', 'N/A')}"
+        )
         if val_info.get('retailer') and val_info['retailer'] != 'none':
             lines.append(f"  Retailer:          {val_info['retailer'].upper()}")
         lines.append("")
@@ -68,13 +157,14 @@ class TextFormatter:
         compliance_symbol = "✓" if status['is_compliant'] else "✗"
         compliance_text = "COMPLIANT" if status['is_compliant'] else "NON-COMPLIANT"
 
-        lines.append("COMPLIANCE STATUS")
-        lines.append("-" * 70)
-        lines.append(f"  Status:            {compliance_symbol} {compliance_text}")
-        lines.append(f"  Total Issues:      {status['total_issues']}")
-        lines.append(f"    Errors:          {status['errors']}")
-        lines.append(f"    Warnings:        {status['warnings']}")
-        lines.append("")
+        lines.append(
+            "COMPLIANCE STATUS\n"
+            f"{_SEP_DASH}\n"
+            f"  Status:            {compliance_symbol} {compliance_text}\n"
+            f"  Total Issues:      {status['total_issues']}\n"
+            f"    Errors:          {status['errors']}\n"
+            f"    Warnings:        {status['warnings']}\n"
+        )
 
         # Issues by Segment (if any)
         if issues:
@@ -82,58 +172,39 @@ class TextFormatter:
             by_segment = stats.get('by_segment', {})
 
             if by_segment:
-                lines.append("ISSUES BY SEGMENT")
-                lines.append("-" * 70)
+                lines.append(f"ISSUES BY SEGMENT\n{_SEP_DASH}")
                 for segment, count in sorted(by_segment.items()):
                     lines.append(f"  {segment:10} {count:3} issue(s)")
                 lines.append("")
 
         # Detailed Issues
         if issues:
-            lines.append("DETAILED ISSUES")
-            lines.append("=" * 70)
-            lines.append("")
-
-            # Group by severity
-            errors = [i for i in issues if i.severity == "ERROR"]
-            warnings = [i for i in issues if i.severity == "WARNING"]
-            info = [i for i in issues if i.severity == "INFO"]
-
-            if errors:
-                lines.append(f"ERRORS ({len(errors)})")
-                lines.append("-" * 70)
-                for idx, error in enumerate(errors, 1):
-                    lines.extend(TextFormatter._format_issue(idx, error))
-                lines.append("")
-
-            if warnings:
-                lines.append(f"WARNINGS ({len(warnings)})")
-                lines.append("-" * 70)
-                for idx, warning in enumerate(warnings, 1):
-                    lines.extend(TextFormatter._format_issue(idx, warning))
-                lines.append("")
-
-            if info:
-                lines.append(f"INFORMATIONAL ({len(info)})")
-                lines.append("-" * 70)
-                for idx, item in enumerate(info, 1):
-                    lines.extend(TextFormatter._format_issue(idx, item))
-                lines.append("")
+            lines.append(f"DETAILED ISSUES\n{_SEP_EQ}\n")
+
+            # Group by severity in a single pass over the issues
+            by_severity = {"ERROR": [], "WARNING": [], "INFO": []}
+            for issue in issues:
+                bucket = by_severity.get(issue.severity)
+                if bucket is not None:
+                    bucket.append(issue)
+
+            for severity, title in _SEVERITY_SECTIONS:
+                bucket = by_severity[severity]
+                if bucket:
+                    lines.append(f"{title} ({len(bucket)})\n{_SEP_DASH}")
+                    for idx, issue in enumerate(bucket, 1):
+                        lines.append(TextFormatter._format_issue(idx, issue))
+                    lines.append("")
         else:
-            lines.append("NO ISSUES FOUND")
-            lines.append("")
-            lines.append("✓ All validation rules passed successfully.")
-            lines.append("")
+            lines.append(_TEXT_NO_ISSUES)
 
         # Footer
-        lines.append("=" * 70)
-        lines.append("END OF REPORT")
-        lines.append("=" * 70)
+        lines.append(_TEXT_FOOTER)
 
         return "\n".join(lines)
 
     @staticmethod
-    def _format_issue(number: int, issue) -> List[str]:
+    def _format_issue(number: int, issue) -> str:
         """
         Format a single issue.
 
@@ -142,28 +213,22 @@ class TextFormatter:
             issue: ValidationError instance
 
         Returns:
-            List of formatted lines
+            Formatted issue block, ending with the blank separator line
         """
-        lines = []
-
         # Issue header
         location = f"Line {issue.line_number}" if issue.line_number else "Unknown location"
         segment = f" | Segment: {issue.segment_id}" if issue.segment_id else ""
         element = f" | Element: {issue.element_position:02d}" if issue.element_position is not None else ""
 
-        lines.append(f"{number}. {location}{segment}{element}")
-        lines.append(f"   Rule:    {issue.rule_id}")
-        lines.append(f"   Message: {issue.message}")
-
-        if issue.expected_value or issue.actual_value:
-            if issue.expected_value:
-                lines.append(f"   Expected: {issue.expected_value}")
-            if issue.actual_value:
-                lines.append(f"   Actual:   {issue.actual_value}")
+        expected = f"\n   Expected: {issue.expected_value}" if issue.expected_value else ""
+        actual = f"\n   Actual:   {issue.actual_value}" if issue.actual_value else ""
 
-        lines.append("")  # Blank line between issues
-
-        return lines
+        # One string per issue; the trailing "\n" is the blank line between issues
+        return (
+            f"{number}. {location}{segment}{element}\n"
+            f"   Rule:    {issue.rule_id}\n"
+            f"   Message: {issue.message}{expected}{actual}\n"
+        )
 
 
 class JSONFormatter:
@@ -183,12 +248,63 @@ class JSONFormatter:
         Returns:
             JSON string
         """
+        report_dict = JSONFormatter._report_dict(validation_result)
+
+        # orjson only supports 2-space indentation
+        if orjson is not None and indent == 2:
+            return orjson.dumps(report_dict, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+        return json.dumps(report_dict, indent=indent)
+
+    @staticmethod
+    def write_report(validation_result, stream, indent: int = 2) -> None:
+        """
+        Write a JSON report to a text stream.
+
+        Equivalent to json.dump: the report is encoded straight into the
+        stream rather than built as one string first.
+
+        Args:
+            validation_result: ValidationResult instance
+            stream: Writable text stream (UTF-8 if it is a file)
+            indent: Number of spaces for indentation
+        """
+        report_dict = JSONFormatter._report_dict(validation_result)
+
+        # orjson only supports 2-space indentation
+        if orjson is not None and indent == 2:
+            data = orjson.dumps(report_dict, option=orjson.OPT_INDENT_2)
+            buffer = getattr(stream, 'buffer', None)
+            if buffer is not None:
+                # orjson already produced UTF-8; skip the decode/re-encode
+                # round trip through the text layer of an open file
+                stream.flush()
+                buffer.write(data)
+            else:
+                stream.write(data.decode('utf-8'))
+            return
+
+        # Encode incrementally so the full JSON string is never held at once
+        for chunk in json.JSONEncoder(indent=indent).iterencode(report_dict):
+            stream.write(chunk)
+
+    @staticmethod
+    def _report_dict(validation_result) -> Dict:
+        """
+        Build the dictionary serialized into the JSON report.
+
+        Args:
+            validation_result: ValidationResult instance
+
+        Returns:
+            Validation result dictionary with a generation timestamp
+        """
         report_dict = validation_result.to_dict()
 
         # Add formatted timestamp
         report_dict['generated_at'] = datetime.now().isoformat()
 
-        return json.dumps(report_dict, indent=indent)
+        return report_dict
 
 
 class CSVFormatter:
@@ -207,26 +323,29 @@ class CSVFormatter:
         Returns:
             CSV string
         """
+        output = StringIO()
+        CSVFormatter.write_report(validation_result, output)
+        return output.getvalue()
+
+    @staticmethod
+    def write_report(validation_result, stream) -> None:
+        """
+        Write a CSV report of issues to a text stream.
+
+        Args:
+            validation_result: ValidationResult instance
+            stream: Writable text stream (open files should use newline='')
+        """
         issues = validation_result.get_all_issues()
 
-        output = StringIO()
-        writer = csv.writer(output)
+        writer = csv.writer(stream)
 
         # Write header
-        writer.writerow([
-            'Severity',
-            'Rule ID',
-            'Segment',
-            'Line Number',
-            'Element Position',
-            'Message',
-            'Expected Value',
-            'Actual Value'
-        ])
+        writer.writerow(_CSV_HEADER)
 
         # Write issues
-        for issue in issues:
-            writer.writerow([
+        writer.writerows(
+            (
                 issue.severity,
                 issue.rule_id,
                 issue.segment_id or '',
@@ -235,9 +354,9 @@ class CSVFormatter:
                 issue.message,
                 issue.expected_value or '',
                 issue.actual_value or ''
-            ])
-
-        return output.getvalue()
+            )
+            for issue in issues
+        )
 
 
 class DashboardFormatter:
@@ -261,84 +380,58 @@ class DashboardFormatter:
         lines = []
 
         # Header
-        lines.append("╔" + "═" * 68 + "╗")
-        lines.append("║" + " " * 20 + "VALIDATION DASHBOARD" + " " * 28 + "║")
-        lines.append("╚" + "═" * 68 + "╝")
-        lines.append("")
+        lines.append(_DASHBOARD_HEADER)
 
         # Status Box
         status = summary['compliance_status']
         is_compliant = status['is_compliant']
-
-        if is_compliant:
-            status_line = "│ STATUS: ✓ COMPLIANT                                             │"
-            color_border = "┌─────────────────────────────────────────────────────────────────┐"
-        else:
-            status_line = "│ STATUS: ✗ NON-COMPLIANT                                          │"
-            color_border = "┌─────────────────────────────────────────────────────────────────┐"
-
-        lines.append(color_border)
-        lines.append(status_line)
-        lines.append("└─────────────────────────────────────────────────────────────────┘")
-        lines.append("")
+        lines.append(_DASHBOARD_STATUS[bool(is_compliant)])
 
         # Quick Stats
-        lines.append("┌─── QUICK STATS ─────────────────────────────────────────────────┐")
-        lines.append(f"│  Total Issues:  {status['total_issues']:3}                                            │")
-        lines.append(f"│  Errors:        {status['errors']:3}                                            │")
-        lines.append(f"│  Warnings:      {status['warnings']:3}                                            │")
-        lines.append("└─────────────────────────────────────────────────────────────────┘")
-        lines.append("")
+        lines.append(_DASHBOARD_QUICK_STATS.format(
+            total=status['total_issues'],
+            errors=status['errors'],
+            warnings=status['warnings']
+        ))
 
         # Document Info
         doc_info = summary['document_info']
-        lines.append("┌─── DOCUMENT INFO ───────────────────────────────────────────────┐")
-        lines.append(f"│  Type:          {doc_info.get('doc_type', 'N/A'):10}                                 │")
-        lines.append(f"│  Sender:        {(doc_info.get('sender', 'N/A')[:20]):20}                   │")
-        lines.append(f"│  Receiver:      {(doc_info.get('receiver', 'N/A')[:20]):20}                   │")
-        lines.append("└─────────────────────────────────────────────────────────────────┘")
-        lines.append("")
+        lines.append(_DASHBOARD_DOCUMENT_INFO.format(
+            doc_type=doc_info.get('doc_type', 'N/A'),
+            sender=doc_info.get('sender', 'N/A')[:20],
+            receiver=doc_info.get('receiver', 'N/A')[:20]
+        ))
 
         # Issues by Segment (Top 5)
         stats = summary['error_statistics']
         by_segment = stats.get('by_segment', {})
 
         if by_segment:
-            lines.append("┌─── TOP SEGMENTS WITH ISSUES ────────────────────────────────────┐")
+            lines.append(_DASHBOARD_TOP_SEGMENTS)
 
             sorted_segments = sorted(by_segment.items(), key=lambda x: x[1], reverse=True)[:5]
 
             for seg_id, count in sorted_segments:
-                bar = "█" * min(count, 30)
-                lines.append(f"│  {seg_id:8} │{bar:30}│ {count:3}    │")
+                lines.append(_DASHBOARD_SEGMENT_ROW.format(
+                    seg_id=seg_id, bar="█" * min(count, 30), count=count
+                ))
 
-            lines.append("└─────────────────────────────────────────────────────────────────┘")
+            lines.append(_BOX_BOTTOM)
             lines.append("")
 
         # Validation Info
         val_info = summary['validation_info']
-        lines.append("┌─── VALIDATION INFO ─────────────────────────────────────────────┐")
-        lines.append(f"│  Time:          {val_info.get('validation_time_seconds', 0):6.3f}s                                 │")
+        lines.append(_DASHBOARD_VALIDATION_TIME.format(
+            seconds=val_info.get('validation_time_seconds', 0)
+        ))
 
         if val_info.get('retailer') and val_info['retailer'] != 'none':
-            retailer = val_info['retailer'].upper()
-            lines.append(f"│  Retailer:      {retailer:20}                   │")
+            lines.append(_DASHBOARD_RETAILER.format(retailer=val_info['retailer'].upper()))
 
-        lines.append("└─────────────────────────────────────────────────────────────────┘")
+        lines.append(_BOX_BOTTOM)
         lines.append("")
 
         # Action Items
-        if not is_compliant:
-            lines.append("┌─── RECOMMENDED ACTIONS ─────────────────────────────────────────┐")
-            lines.append("│  1. Review ERROR-level violations (blocking issues)            │")
-            lines.append("│  2. Address mandatory segment/element requirements             │")
-            lines.append("│  3. Verify retailer-specific formatting rules                  │")
-            lines.append("│  4. Re-validate after corrections                              │")
-            lines.append("└─────────────────────────────────────────────────────────────────┘")
-        else:
-            lines.append("┌─── NEXT STEPS ──────────────────────────────────────────────────┐")
-            lines.append("│  ✓ Document passed all validation rules                        │")
-            lines.append("│  ✓ Ready for transmission                                      │")
-            lines.append("└─────────────────────────────────────────────────────────────────┘")
+        lines.append(_DASHBOARD_NEXT_STEPS if is_compliant else _DASHBOARD_ACTIONS)
 
         return "\n".join(lines)
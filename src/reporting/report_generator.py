@@ -32,7 +32,9 @@ Usage:
 """
 
 import logging
-from pathlib import Path
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional
 
 from .formatters import TextFormatter, JSONFormatter, CSVFormatter, DashboardFormatter
@@ -41,6 +43,52 @@ from .formatters import TextFormatter, JSONFormatter, CSVFormatter, DashboardFor
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Buffer size for reports streamed to disk
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+class _ResultSnapshot:
+    """
+    Read-through view of a ValidationResult for the formatters.
+
+    The summary and issue list are computed on first use and shared, so
+    rendering several formats walks the validation result only once.
+    """
+
+    def __init__(self, validation_result):
+        """
+        Initialize the snapshot.
+
+        Args:
+            validation_result: ValidationResult instance to wrap
+        """
+        self._result = validation_result
+        self._summary = None
+        self._issues = None
+
+    def get_summary(self) -> dict:
+        """Get the validation summary, computed once."""
+        if self._summary is None:
+            self._summary = self._result.get_summary()
+        return self._summary
+
+    def get_all_issues(self) -> list:
+        """Get all issues (ERROR + WARNING + INFO), gathered once."""
+        if self._issues is None:
+            self._issues = self._result.get_all_issues()
+        return self._issues
+
+    def to_dict(self) -> dict:
+        """Same structure as ValidationResult.to_dict(), from the shared data."""
+        return {
+            "summary": self.get_summary(),
+            "issues": [error.to_dict() for error in self.get_all_issues()]
+        }
+
+    def __getattr__(self, name):
+        """Delegate everything else to the wrapped result."""
+        return getattr(self._result, name)
+
 
 class ReportGenerator:
     """
@@ -56,6 +104,39 @@ class ReportGenerator:
         """
         self.validation_result = validation_result
 
+        # Rendered reports keyed by (format, indent); each is built once
+        self._cache = {}
+
+        # Shared summary/issue traversal handed to every formatter
+        self._snapshot = _ResultSnapshot(validation_result)
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop cached reports so the next call re-renders them.
+
+        Call this if the validation result is modified after reports were generated.
+        """
+        self._cache.clear()
+        self._snapshot = _ResultSnapshot(self.validation_result)
+
+    def _render(self, key: tuple, formatter, **kwargs) -> str:
+        """
+        Render a report through a formatter, reusing any cached output.
+
+        Args:
+            key: Cache key identifying the format and its options
+            formatter: Formatter class exposing format_report()
+            **kwargs: Extra options passed to the formatter
+
+        Returns:
+            Rendered report string
+        """
+        report = self._cache.get(key)
+        if report is None:
+            report = formatter.format_report(self._snapshot, **kwargs)
+            self._cache[key] = report
+        return report
+
     def generate_text_report(self) -> str:
         """
         Generate a human-readable text report.
@@ -63,7 +144,7 @@ class ReportGenerator:
         Returns:
             Formatted text report
         """
-        return TextFormatter.format_report(self.validation_result)
+        return self._render(("text", None), TextFormatter)
 
     def generate_json_report(self, indent: int = 2) -> str:
         """
@@ -75,7 +156,7 @@ class ReportGenerator:
         Returns:
             JSON string
         """
-        return JSONFormatter.format_report(self.validation_result, indent=indent)
+        return self._render(("json", indent), JSONFormatter, indent=indent)
 
     def generate_csv_report(self) -> str:
         """
@@ -84,7 +165,7 @@ class ReportGenerator:
         Returns:
             CSV string
         """
-        return CSVFormatter.format_report(self.validation_result)
+        return self._render(("csv", None), CSVFormatter)
 
     def generate_dashboard(self) -> str:
         """
@@ -93,14 +174,14 @@ class ReportGenerator:
         Returns:
             Dashboard string
         """
-        return DashboardFormatter.format_report(self.validation_result)
+        return self._render(("dashboard", None), DashboardFormatter)
 
     def save_report(
         self,
         output_path: str,
         format: str = "text",
         indent: Optional[int] = 2
-    ) -> None:
+    ) -> int:
         """
         Save report to a file.
 
@@ -109,17 +190,23 @@ class ReportGenerator:
             format: Report format ('text', 'json', 'csv', 'dashboard')
             indent: Indentation for JSON (only used if format='json')
 
+        Returns:
+            Number of bytes written
+
         Raises:
             ValueError: If format is not supported
         """
         format = format.lower()
 
+        # JSON and CSV are streamed to disk unless already rendered and cached
         if format == "text":
             content = self.generate_text_report()
         elif format == "json":
-            content = self.generate_json_report(indent=indent)
+            content = self._cache.get(("json", indent))
+            write_report = partial(JSONFormatter.write_report, indent=indent)
         elif format == "csv":
-            content = self.generate_csv_report()
+            content = self._cache.get(("csv", None))
+            write_report = CSVFormatter.write_report
         elif format == "dashboard":
             content = self.generate_dashboard()
         else:
@@ -129,22 +216,42 @@ class ReportGenerator:
             )
 
         # Ensure output directory exists
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        if content is None:
+            # Format straight into a large write buffer instead of building the
+            # whole string first; many small writes become a few syscalls
+            with open(output_path, 'w', encoding='utf-8', newline='',
+                      buffering=_WRITE_BUFFER_SIZE) as f:
+                write_report(self._snapshot, f)
+                f.flush()
+                size = f.buffer.tell()
+        else:
+            # Write file; the encoded length doubles as the file size
+            data = content.encode('utf-8')
+            with open(output_path, 'wb') as f:
+                f.write(data)
+            size = len(data)
 
         logger.info(f"Report saved: {output_path} ({format} format)")
 
-    def save_all_formats(self, base_path: str, base_name: str = "report") -> dict:
+        return size
+
+    def save_all_formats(
+        self,
+        base_path: str,
+        base_name: str = "report",
+        include_sizes: bool = False
+    ) -> dict:
         """
         Save reports in all formats.
 
         Args:
             base_path: Directory where reports should be saved
             base_name: Base filename (without extension)
+            include_sizes: If True, map each format to (file path, bytes written)
 
         Returns:
             Dictionary mapping format to file path
@@ -158,30 +265,33 @@ class ReportGenerator:
                 'dashboard': 'output/validation_report_dashboard.txt'
             }
         """
-        base_dir = Path(base_path)
-        base_dir.mkdir(parents=True, exist_ok=True)
-
-        files = {}
-
-        # Text report
-        text_path = base_dir / f"{base_name}.txt"
-        self.save_report(str(text_path), format="text")
-        files['text'] = str(text_path)
-
-        # JSON report
-        json_path = base_dir / f"{base_name}.json"
-        self.save_report(str(json_path), format="json")
-        files['json'] = str(json_path)
-
-        # CSV report
-        csv_path = base_dir / f"{base_name}.csv"
-        self.save_report(str(csv_path), format="csv")
-        files['csv'] = str(csv_path)
+        os.makedirs(base_path, exist_ok=True)
+
+        # Plain string paths; save_report opens them without going through pathlib
+        join = os.path.join
+        targets = {
+            'text': join(base_path, f"{base_name}.txt"),
+            'json': join(base_path, f"{base_name}.json"),
+            'csv': join(base_path, f"{base_name}.csv"),
+            'dashboard': join(base_path, f"{base_name}_dashboard.txt"),
+        }
+
+        # Compute the shared summary/issue data up front so the worker
+        # threads don't each start the traversal
+        self._snapshot.get_summary()
+        self._snapshot.get_all_issues()
+
+        # The four saves are independent; overlap their formatting and I/O
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            sizes = pool.map(
+                lambda item: self.save_report(item[1], format=item[0]),
+                targets.items()
+            )
 
-        # Dashboard
-        dashboard_path = base_dir / f"{base_name}_dashboard.txt"
-        self.save_report(str(dashboard_path), format="dashboard")
-        files['dashboard'] = str(dashboard_path)
+            files = {
+                format_name: (file_path, size) if include_sizes else file_path
+                for (format_name, file_path), size in zip(targets.items(), sizes)
+            }
 
         logger.info(f"All reports saved to: {base_path}")
 
@@ -199,12 +309,17 @@ class ReportGenerator:
         symbol = "✓" if status['is_compliant'] else "✗"
         status_text = "COMPLIANT" if status['is_compliant'] else "NON-COMPLIANT"
 
-        print(f"\n{symbol} {status_text}")
-        print(f"   Errors: {status['errors']}, Warnings: {status['warnings']}")
+        lines = [
+            f"\n{symbol} {status_text}",
+            f"   Errors: {status['errors']}, Warnings: {status['warnings']}"
+        ]
 
         if not status['is_compliant']:
             errors = self.validation_result.get_errors()
-            print(f"\n   First error: {errors[0].message}" if errors else "")
+            lines.append(f"\n   First error: {errors[0].message}" if errors else "")
+
+        # One write to the console instead of one per line
+        print("\n".join(lines))
 
     def __repr__(self) -> str:
         """String representation of generator."""
@@ -13,9 +13,16 @@ When rules with the same rule_id exist at multiple levels, higher priority wins.
 
 import json
 import logging
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-from copy import deepcopy
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
 from config.settings import (
     X12_CORE_RULES,
@@ -32,6 +39,102 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _cached_load(path_str: str, mtime: float) -> Dict:
+    """
+    Parse a JSON rule file, memoized by path and modification time.
+
+    The mtime is part of the cache key, so editing a rule file on disk
+    invalidates its entry automatically.
+
+    Args:
+        path_str: Path to JSON file
+        mtime: Modification time of the file when it was looked up
+
+    Returns:
+        Parsed JSON, read-only at every level (shared between callers)
+    """
+    if orjson is not None:
+        with open(path_str, 'rb') as f:
+            return _read_only(orjson.loads(f.read()))
+
+    with open(path_str, 'r', encoding='utf-8') as f:
+        return _read_only(json.load(f))
+
+
+def _reject_change(self, *args, **kwargs):
+    """Raise for any attempt to modify a read-only rule container."""
+    raise TypeError(f"{type(self).__name__} is read-only; rules are shared between loaders")
+
+
+class _ReadOnlyDict(dict):
+    """
+    Dictionary that cannot be modified after construction.
+
+    Still a dict, so it compares, prints, pickles and serializes to JSON
+    like the parsed rule it replaces.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _reject_change
+    clear = pop = popitem = setdefault = update = _reject_change
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class _ReadOnlyList(list):
+    """List counterpart of _ReadOnlyDict."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _reject_change
+    append = extend = insert = pop = remove = clear = sort = reverse = _reject_change
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+def _read_only(value):
+    """
+    Freeze a parsed rule structure, reusing parts that are already frozen.
+
+    Rule files are frozen once when loaded, so a merge only wraps its own
+    top-level dictionary and category lists (plus any overridden rules).
+
+    Args:
+        value: Rule structure or scalar
+
+    Returns:
+        Read-only equivalent of value
+    """
+    if isinstance(value, (_ReadOnlyDict, _ReadOnlyList)):
+        return value
+    if isinstance(value, dict):
+        return _ReadOnlyDict({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return _ReadOnlyList([_read_only(item) for item in value])
+    return value
+
+
+def _thaw(value):
+    """
+    Deep-copy a (possibly read-only) rule structure into plain dicts and lists.
+
+    Args:
+        value: Rule structure or scalar
+
+    Returns:
+        Modifiable copy of value
+    """
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_thaw(item) for item in value]
+    return value
+
+
 class RuleLoader:
     """
     Loads and merges EDI validation rules from JSON files.
@@ -39,12 +142,22 @@ class RuleLoader:
     Handles rule priority: Retailer > Document > Core
     """
 
+    # Merged rulesets shared across instances, keyed by (doc_type, retailer)
+    _merged_cache: Dict[tuple, tuple] = {}
+    _MERGED_CACHE_SIZE = 16
+    # Streamlit sessions share the cache from separate threads
+    _merged_cache_lock = threading.Lock()
+
     def __init__(self):
         """Initialize the rule loader."""
         self.core_rules = {}
         self.document_rules = {}
         self.retailer_rules = {}
         self.merged_rules = {}
+        self._rule_locator = {}
+        self._rule_by_id = {}
+        self._segment_index = {}
+        self._stats = {}
 
     def load_core_rules(self) -> Dict:
         """
@@ -130,7 +243,9 @@ class RuleLoader:
             retailer: Optional retailer name (e.g., "walmart", "amazon")
 
         Returns:
-            Merged ruleset with all applicable rules
+            Merged ruleset with all applicable rules. The ruleset is cached
+            and shared between loaders, so it is read-only at every level;
+            attempts to modify it raise TypeError.
 
         Example:
             >>> loader = RuleLoader()
@@ -148,15 +263,96 @@ class RuleLoader:
         if retailer:
             ret = self.load_retailer_rules(retailer)
 
+        # Source files are cached by mtime, so the same parsed objects mean
+        # none of the rule files changed since the cached merge
+        key = (doc_type, retailer)
+        sources = (core, doc, ret or None)
+        with self._merged_cache_lock:
+            cached = self._merged_cache.get(key)
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            (_, self.merged_rules, self._rule_locator,
+             self._rule_by_id, self._segment_index, self._stats) = cached
+            return self.merged_rules
+
         # Merge in priority order: core -> document -> retailer
         self.merged_rules = self._merge_rulesets(core, doc, ret, doc_type, retailer)
+        self._build_indexes()
+
+        with self._merged_cache_lock:
+            if key not in self._merged_cache and len(self._merged_cache) >= self._MERGED_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._merged_cache[next(iter(self._merged_cache))]
+            self._merged_cache[key] = (
+                sources, self.merged_rules, self._rule_locator,
+                self._rule_by_id, self._segment_index, self._stats
+            )
 
         return self.merged_rules
 
+    def _build_indexes(self):
+        """
+        Index the merged ruleset by rule_id and by segment_id, and count
+        rules for get_statistics.
+
+        Makes get_rule_by_id and get_rules_by_segment dictionary lookups
+        instead of scans over every rule category. The merged rules are
+        already read-only, so the indexes hold them directly.
+        """
+        merged = self.merged_rules
+
+        # The first location matches the category scan order
+        rule_by_id = {
+            rule_id: merged[category][index]
+            for rule_id, ((category, index), *_) in self._rule_locator.items()
+        }
+
+        # Optional categories are added after overrides, so not located yet
+        for category in ("segment_sequences", "business_rules"):
+            for rule in merged.get(category, []):
+                rule_id = rule.get("rule_id")
+                if rule_id is not None and rule_id not in rule_by_id:
+                    # First match wins, as with the category scan
+                    rule_by_id[rule_id] = rule
+
+        segment_index = {}
+        for category in ("required_segments", "element_rules"):
+            for rule in merged.get(category, []):
+                segment_index.setdefault(rule.get("segment_id"), []).append(rule)
+        for rule in merged.get("conditional_rules", []):
+            if_segment = rule.get("condition", {}).get("if_segment")
+            segment_index.setdefault(if_segment, []).append(rule)
+
+        stats = {
+            "total_rules": 0,
+            "by_category": {},
+            "by_severity": {"ERROR": 0, "WARNING": 0, "INFO": 0}
+        }
+
+        for category, rules in merged.items():
+            if isinstance(rules, list):
+                count = len(rules)
+                stats["by_category"][category] = count
+                stats["total_rules"] += count
+
+                # Count by severity
+                for rule in rules:
+                    severity = rule.get("severity")
+                    if severity in stats["by_severity"]:
+                        stats["by_severity"][severity] += 1
+
+        self._stats = stats
+        self._rule_by_id = rule_by_id
+        self._segment_index = {
+            segment_id: tuple(rules) for segment_id, rules in segment_index.items()
+        }
+
     def _load_json_file(self, file_path: Path) -> Dict:
         """
         Load a JSON rule file.
 
+        Parsed files are cached across RuleLoader instances and shared,
+        so the returned dictionary is read-only.
+
         Args:
             file_path: Path to JSON file
 
@@ -167,16 +363,16 @@ class RuleLoader:
             FileNotFoundError: If file doesn't exist
             json.JSONDecodeError: If JSON is invalid
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"Rule file not found: {file_path}")
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Rule file not found: {file_path}") from None
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            try:
-                data = json.load(f)
-                return data
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in {file_path}: {e}")
-                raise
+        try:
+            return _cached_load(os.fspath(file_path), mtime)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in {file_path}: {e}")
+            raise
 
     def _merge_rulesets(self, core: Dict, doc: Dict, ret: Dict,
                        doc_type: str, retailer: Optional[str]) -> Dict:
@@ -224,37 +420,58 @@ class RuleLoader:
             "cross_segment_rules"
         ]
 
+        # Drop retailer rules for other document types once, up front
+        ret_applicable = {
+            category: [
+                rule for rule in ret.get(category, [])
+                if not rule.get("applies_to_doc_types")
+                or doc_type in rule["applies_to_doc_types"]
+            ]
+            for category in rule_categories
+        }
+
         for category in rule_categories:
-            # Start with core rules
+            # Nothing to merge when no source defines this category
+            if not (core.get(category) or doc.get(category) or ret_applicable[category]):
+                merged[category] = []
+                continue
+
+            # Start with core rules. Rules are shared with the (read-only)
+            # source dictionaries; _apply_overrides copies any rule it changes.
             category_rules = {}
 
             # Add core rules
             for rule in core.get(category, []):
                 rule_id = rule.get("rule_id")
                 if rule_id:
-                    category_rules[rule_id] = deepcopy(rule)
+                    category_rules[rule_id] = rule
 
             # Override with document rules
             for rule in doc.get(category, []):
                 rule_id = rule.get("rule_id")
                 if rule_id:
-                    category_rules[rule_id] = deepcopy(rule)
+                    category_rules[rule_id] = rule
 
             # Override with retailer rules (highest priority)
-            for rule in ret.get(category, []):
+            for rule in ret_applicable[category]:
                 rule_id = rule.get("rule_id")
                 if rule_id:
-                    # Check if rule applies to this document type
-                    applies_to = rule.get("applies_to_doc_types", [])
-                    if not applies_to or doc_type in applies_to:
-                        category_rules[rule_id] = deepcopy(rule)
+                    category_rules[rule_id] = rule
 
             # Convert back to list
             merged[category] = list(category_rules.values())
 
+        # Locate each rule once; shared by overrides and get_rule_by_id.
+        # A rule_id may appear in several categories, so keep every location.
+        rule_locator = {}
+        for category in rule_categories:
+            for index, rule in enumerate(merged[category]):
+                rule_locator.setdefault(rule["rule_id"], []).append((category, index))
+        self._rule_locator = rule_locator
+
         # Apply retailer overrides
         if ret and "overrides" in ret:
-            merged = self._apply_overrides(merged, ret["overrides"])
+            merged = self._apply_overrides(merged, ret["overrides"], rule_locator)
 
         # Add optional categories if present
         optional_categories = ["segment_sequences", "business_rules"]
@@ -264,19 +481,29 @@ class RuleLoader:
             if category in ret:
                 merged[category] = merged.get(category, []) + ret[category]
 
-        return merged
+        # Only the new containers and overridden rules need freezing
+        return _read_only(merged)
 
-    def _apply_overrides(self, ruleset: Dict, overrides: List[Dict]) -> Dict:
+    def _apply_overrides(self, ruleset: Dict, overrides: List[Dict],
+                         rule_locator: Dict[str, List[Tuple[str, int]]]) -> Dict:
         """
         Apply retailer-specific overrides to rules.
 
+        Merged rules are the read-only rules of the loaded source rulesets,
+        so each copy of a rule is thawed into a plain copy (once) before an
+        override changes it; _merge_rulesets freezes the result.
+
         Args:
             ruleset: The merged ruleset
             overrides: List of override specifications
+            rule_locator: Maps rule_id to every (category, index) it has
+                in ruleset
 
         Returns:
             Ruleset with overrides applied
         """
+        copied = set()
+
         for override in overrides:
             rule_id = override.get("rule_id")
             override_type = override.get("override_type")
@@ -284,27 +511,28 @@ class RuleLoader:
             if not rule_id or not override_type:
                 continue
 
-            # Find the rule to override
-            for category in ruleset.keys():
-                if not isinstance(ruleset[category], list):
-                    continue
-
-                for rule in ruleset[category]:
-                    if rule.get("rule_id") == rule_id:
-                        if override_type == "severity_escalation":
-                            rule["severity"] = override["new_severity"]
-                            logger.info(
-                                f"Override applied: {rule_id} severity "
-                                f"escalated to {override['new_severity']}"
-                            )
-                        elif override_type == "add_allowed_value":
-                            if "validations" in rule and "allowed_values" in rule["validations"]:
-                                rule["validations"]["allowed_values"].extend(
-                                    override.get("new_allowed_values", [])
-                                )
-                                logger.info(
-                                    f"Override applied: {rule_id} added allowed values"
-                                )
+            # Find every copy of the rule to override
+            for location in rule_locator.get(rule_id, ()):
+                category, index = location
+                rule = ruleset[category][index]
+                if location not in copied:
+                    rule = ruleset[category][index] = _thaw(rule)
+                    copied.add(location)
+
+                if override_type == "severity_escalation":
+                    rule["severity"] = override["new_severity"]
+                    logger.info(
+                        f"Override applied: {rule_id} severity "
+                        f"escalated to {override['new_severity']}"
+                    )
+                elif override_type == "add_allowed_value":
+                    if "validations" in rule and "allowed_values" in rule["validations"]:
+                        rule["validations"]["allowed_values"].extend(
+                            override.get("new_allowed_values", [])
+                        )
+                        logger.info(
+                            f"Override applied: {rule_id} added allowed values"
+                        )
 
         return ruleset
 
@@ -316,22 +544,14 @@ class RuleLoader:
             rule_id: The rule identifier to find
 
         Returns:
-            Rule dictionary if found, None otherwise
+            Read-only rule if found, None otherwise
         """
         if not self.merged_rules:
             return None
 
-        for category in self.merged_rules.keys():
-            if not isinstance(self.merged_rules[category], list):
-                continue
-
-            for rule in self.merged_rules[category]:
-                if rule.get("rule_id") == rule_id:
-                    return rule
-
-        return None
+        return self._rule_by_id.get(rule_id)
 
-    def get_rules_by_segment(self, segment_id: str) -> List[Dict]:
+    def get_rules_by_segment(self, segment_id: str) -> Tuple[Dict, ...]:
         """
         Get all rules that apply to a specific segment.
 
@@ -339,30 +559,12 @@ class RuleLoader:
             segment_id: The segment identifier (e.g., "BEG", "PO1")
 
         Returns:
-            List of rules applying to this segment
+            Tuple of read-only rules applying to this segment
         """
         if not self.merged_rules:
-            return []
-
-        matching_rules = []
-
-        # Check required_segments
-        for rule in self.merged_rules.get("required_segments", []):
-            if rule.get("segment_id") == segment_id:
-                matching_rules.append(rule)
-
-        # Check element_rules
-        for rule in self.merged_rules.get("element_rules", []):
-            if rule.get("segment_id") == segment_id:
-                matching_rules.append(rule)
+            return ()
 
-        # Check conditional_rules
-        for rule in self.merged_rules.get("conditional_rules", []):
-            condition = rule.get("condition", {})
-            if condition.get("if_segment") == segment_id:
-                matching_rules.append(rule)
-
-        return matching_rules
+        return self._segment_index.get(segment_id, ())
 
     def get_statistics(self) -> Dict:
         """
@@ -374,26 +576,14 @@ class RuleLoader:
         if not self.merged_rules:
             return {}
 
-        stats = {
-            "total_rules": 0,
-            "by_category": {},
-            "by_severity": {"ERROR": 0, "WARNING": 0, "INFO": 0}
+        # Computed once per merge in _build_indexes
+        stats = self._stats
+        return {
+            "total_rules": stats["total_rules"],
+            "by_category": dict(stats["by_category"]),
+            "by_severity": dict(stats["by_severity"])
         }
 
-        for category, rules in self.merged_rules.items():
-            if isinstance(rules, list):
-                count = len(rules)
-                stats["by_category"][category] = count
-                stats["total_rules"] += count
-
-                # Count by severity
-                for rule in rules:
-                    severity = rule.get("severity")
-                    if severity in stats["by_severity"]:
-                        stats["by_severity"][severity] += 1
-
-        return stats
-
     def to_json(self, indent: int = 2) -> str:
         """
         Export merged rules as JSON string.
@@ -404,6 +594,10 @@ class RuleLoader:
         Returns:
             JSON string representation
         """
+        # orjson only supports 2-space indentation
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.merged_rules, option=orjson.OPT_INDENT_2).decode('utf-8')
+
         return json.dumps(self.merged_rules, indent=indent)
 
     def __repr__(self) -> str:
@@ -13,17 +13,18 @@ Features:
 """
 
 import streamlit as st
+import hashlib
 import sys
+from io import BytesIO
 from pathlib import Path
-from io import BytesIO, StringIO
-import tempfile
+from typing import Dict, Optional, Tuple, Union
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.parser.edi_parser import EDIParser
 from src.rules.rule_loader import RuleLoader
-from src.validator.validation_engine import ValidationEngine
+from src.validator.validation_engine import ValidationEngine, ValidationResult
 from src.reporting.report_generator import ReportGenerator
 
 
@@ -36,6 +37,243 @@ st.set_page_config(
 )
 
 
+# Issues rendered per page in the Issues List tab
+ISSUES_PER_PAGE = 25
+
+# Bytes of an uploaded file read for its preview
+PREVIEW_BYTES = 8192
+
+# Marker shown next to each issue in the Issues List tab
+SEVERITY_EMOJI = {
+    "ERROR": "🔴",
+    "WARNING": "🟡",
+    "INFO": "🔵"
+}
+
+# st.fragment (Streamlit 1.37+) reruns only the decorated function when one
+# of its widgets changes; older versions rerun the whole script as before
+fragment = getattr(st, "fragment", None) or (lambda func: func)
+
+
+def _head_text(text: str, max_lines: int) -> str:
+    """Return the first max_lines lines of text without splitting all of it."""
+    end = -1
+    for _ in range(max_lines):
+        end = text.find('\n', end + 1)
+        if end < 0:
+            return text
+    return text[:end]
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def get_rules(doc_type: str, retailer: Optional[str]) -> Dict:
+    """
+    Load the merged ruleset once per (doc_type, retailer) for all sessions.
+
+    The ruleset is shared, not copied, so it must be treated as read-only
+    (as with RuleLoader.load_rules).
+    """
+    return RuleLoader().load_rules(doc_type, retailer)
+
+
+def get_parser() -> EDIParser:
+    """Return this session's parser, created on first use."""
+    # Parsers and engines keep per-run state, so they are reused within a
+    # session rather than shared across sessions with st.cache_resource
+    if 'edi_parser' not in st.session_state:
+        st.session_state['edi_parser'] = EDIParser()
+    return st.session_state['edi_parser']
+
+
+def get_engine() -> ValidationEngine:
+    """Return this session's validation engine, created on first use."""
+    if 'validation_engine' not in st.session_state:
+        st.session_state['validation_engine'] = ValidationEngine()
+    return st.session_state['validation_engine']
+
+
+def content_hash(edi_source: Union[str, bytes]) -> str:
+    """
+    Return a short digest of the EDI content, used as its cache key.
+
+    Args:
+        edi_source: Pasted or sample EDI text, or uploaded bytes
+    """
+    if isinstance(edi_source, str):
+        edi_source = edi_source.encode('utf-8')
+
+    return hashlib.blake2b(edi_source, digest_size=16).hexdigest()
+
+
+def _head_bytes(data: bytes, max_lines: int) -> Tuple[str, bool]:
+    """
+    Decode the start of uploaded bytes for previewing.
+
+    Args:
+        data: Uploaded EDI content
+        max_lines: Maximum number of lines to return
+
+    Returns:
+        Tuple of (preview text, whether more content follows)
+    """
+    text = data[:PREVIEW_BYTES].decode('utf-8', errors='replace')
+    preview = _head_text(text, max_lines)
+    return preview, len(data) > PREVIEW_BYTES or len(preview) < len(text)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def run_validation(
+    edi_hash: str,
+    doc_type: str,
+    retailer: Optional[str],
+    include_info: bool,
+    _edi_source: Union[str, bytes],
+    _parser: EDIParser,
+    _engine: ValidationEngine
+) -> Tuple[ValidationResult, Dict]:
+    """
+    Parse and validate EDI content, memoized by content hash and settings.
+
+    Arguments with a leading underscore are not hashed by Streamlit; the
+    content is identified by edi_hash instead of hashing all of it.
+
+    Uploads are validated as their segments are parsed, so no parsed copy
+    of the whole document is built; their parsed EDI has metadata and
+    statistics but no segment list.
+
+    Args:
+        edi_hash: content_hash() of the EDI content
+        doc_type: Transaction set type (e.g., "850")
+        retailer: Optional retailer name
+        include_info: Whether INFO-level issues are collected
+        _edi_source: Raw EDI text, or uploaded bytes
+        _parser: Parser to use on a cache miss
+        _engine: Validation engine to use on a cache miss
+
+    Returns:
+        Tuple of (validation result, parsed EDI document)
+    """
+    rules = get_rules(doc_type, retailer)
+
+    if isinstance(_edi_source, str):
+        parsed_edi = _parser.parse_text(_edi_source)
+        result = _engine.validate(parsed_edi, rules, retailer, collect_info=include_info)
+        return result, parsed_edi
+
+    metadata = {}
+    segments = _parser.iter_parsed_segments(BytesIO(_edi_source), metadata=metadata)
+    result = _engine.validate_stream(
+        segments, rules, retailer, collect_info=include_info, metadata=metadata
+    )
+    return result, result.parsed_edi
+
+
+@fragment
+def render_issues_tab(result: ValidationResult) -> None:
+    """
+    Render the Issues List tab.
+
+    Runs as a fragment, so changing the severity filter or page reruns only
+    this tab instead of the whole app.
+
+    Args:
+        result: Validation result to list issues from
+    """
+    st.subheader("Issues List")
+
+    if result.total_issues() > 0:
+        issues = result.get_all_issues()
+
+        # Filter by severity
+        severity_filter = st.multiselect(
+            "Filter by severity",
+            options=["ERROR", "WARNING", "INFO"],
+            default=["ERROR", "WARNING", "INFO"]
+        )
+
+        filtered_issues = [i for i in issues if i.severity in severity_filter]
+
+        # Render one page of expanders per rerun instead of one
+        # expander per issue
+        page_count = max(1, (len(filtered_issues) + ISSUES_PER_PAGE - 1) // ISSUES_PER_PAGE)
+        page = 1
+        if page_count > 1:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1)
+        start = (page - 1) * ISSUES_PER_PAGE
+        page_issues = filtered_issues[start:start + ISSUES_PER_PAGE]
+
+        st.write(
+            f"Showing {start + 1 if page_issues else 0}-{start + len(page_issues)} "
+            f"of {len(filtered_issues)} filtered issues ({len(issues)} total)"
+        )
+
+        # Display issues
+        for idx, issue in enumerate(page_issues, start + 1):
+            severity_color = SEVERITY_EMOJI.get(issue.severity, "⚪")
+
+            with st.expander(f"{severity_color} Issue #{idx} - {issue.severity} - Line {issue.line_number or 'N/A'}"):
+                st.write(f"**Rule:** {issue.rule_id}")
+                st.write(f"**Segment:** {issue.segment_id or 'N/A'}")
+                st.write(f"**Message:** {issue.message}")
+
+                if issue.expected_value:
+                    st.write(f"**Expected:** {issue.expected_value}")
+                if issue.actual_value:
+                    st.write(f"**Actual:** {issue.actual_value}")
+    else:
+        st.success("✅ No issues found - document is fully compliant!")
+
+
+@fragment
+def render_downloads_tab(blobs: Dict[str, bytes], doc_type: str) -> None:
+    """
+    Render the Downloads tab from the prerendered reports.
+
+    Args:
+        blobs: UTF-8 encoded report contents keyed by format
+        doc_type: Document type used in the file names
+    """
+    st.subheader("Download Reports")
+
+    col_d1, col_d2 = st.columns(2)
+
+    with col_d1:
+        # Text report download
+        st.download_button(
+            label="📄 Download Text Report",
+            data=blobs["text"],
+            file_name=f"validation_report_{doc_type}.txt",
+            mime="text/plain"
+        )
+
+        # JSON report download
+        st.download_button(
+            label="📊 Download JSON Report",
+            data=blobs["json"],
+            file_name=f"validation_report_{doc_type}.json",
+            mime="application/json"
+        )
+
+    with col_d2:
+        # CSV report download
+        st.download_button(
+            label="📈 Download CSV Report",
+            data=blobs["csv"],
+            file_name=f"validation_report_{doc_type}.csv",
+            mime="text/csv"
+        )
+
+        # Dashboard download
+        st.download_button(
+            label="📋 Download Dashboard",
+            data=blobs["dashboard"],
+            file_name=f"validation_dashboard_{doc_type}.txt",
+            mime="text/plain"
+        )
+
+    st.info("💡 All reports are available for download in multiple formats")
+
+
 def main():
     """Main Streamlit application."""
 
@@ -73,6 +311,12 @@ def main():
     )
     retailer = retailer_options[retailer_display]
 
+    include_info = st.sidebar.checkbox(
+        "Include INFO diagnostics",
+        value=False,
+        help="Also collect informational notes; skipped by default to keep runs lean"
+    )
+
     st.sidebar.markdown("---")
 
     # Input method selection
@@ -113,6 +357,7 @@ def main():
         st.header("📄 EDI Document Input")
 
         edi_text = None
+        uploaded_file = None
         file_name = None
 
         if input_method == "Upload File":
@@ -123,7 +368,7 @@ def main():
             )
 
             if uploaded_file:
-                edi_text = uploaded_file.read().decode('utf-8')
+                # The upload's bytes are read with getvalue() when validating
                 file_name = uploaded_file.name
                 st.success(f"✅ Loaded: {file_name}")
 
@@ -152,48 +397,62 @@ def main():
             sample_path = sample_files[selected_sample]
 
             try:
-                with open(sample_path, 'r') as f:
-                    edi_text = f.read()
+                edi_text = Path(sample_path).read_text(encoding='utf-8')
                 file_name = sample_path
                 st.success(f"✅ Loaded: {selected_sample}")
             except FileNotFoundError:
                 st.error(f"❌ Sample file not found: {sample_path}")
 
         # Preview
-        if edi_text:
+        if uploaded_file:
+            with st.expander("📝 Preview EDI Content"):
+                preview, truncated = _head_bytes(uploaded_file.getvalue(), 20)
+                if truncated:
+                    preview += "\n\n... (more content)"
+                st.code(preview, language="text")
+        elif edi_text:
             with st.expander("📝 Preview EDI Content"):
-                lines = edi_text.split('\n')
-                preview = '\n'.join(lines[:20])
-                if len(lines) > 20:
-                    preview += f"\n\n... ({len(lines) - 20} more lines)"
+                line_count = edi_text.count('\n') + 1
+                preview = _head_text(edi_text, 20)
+                if line_count > 20:
+                    preview += f"\n\n... ({line_count - 20} more lines)"
                 st.code(preview, language="text")
 
     with col2:
         st.header("🔍 Validation Results")
 
-        if edi_text:
+        # Uploads are already in memory; getvalue() hands over their bytes,
+        # which are decoded chunk by chunk as they are validated
+        edi_source = uploaded_file.getvalue() if uploaded_file else edi_text
+        if edi_source:
             # Validate button
             if st.button("🚀 Run Validation", type="primary", use_container_width=True):
                 with st.spinner("Validating EDI document..."):
                     try:
-                        # Parse EDI
-                        parser = EDIParser()
-                        parsed_edi = parser.parse_text(edi_text)
-
-                        # Load rules
-                        loader = RuleLoader()
-                        rules = loader.load_rules(doc_type, retailer)
-
-                        # Validate
-                        engine = ValidationEngine()
-                        result = engine.validate(parsed_edi, rules, retailer)
-
-                        # Generate reports
+                        # Parse and validate (cached per content and settings)
+                        result, parsed_edi = run_validation(
+                            content_hash(edi_source), doc_type, retailer, include_info,
+                            edi_source, get_parser(), get_engine()
+                        )
+
+                        # Render every report format once per validation;
+                        # reruns read the strings back from session state
                         generator = ReportGenerator(result)
-
-                        # Store in session state
+                        reports = {
+                            "text": generator.generate_text_report(),
+                            "json": generator.generate_json_report(),
+                            "csv": generator.generate_csv_report(),
+                            "dashboard": generator.generate_dashboard()
+                        }
+
+                        # Store in session state; downloads get bytes so
+                        # Streamlit does not re-encode them on every rerun
                         st.session_state['validation_result'] = result
-                        st.session_state['report_generator'] = generator
+                        st.session_state['reports'] = reports
+                        st.session_state['download_blobs'] = {
+                            name: content.encode('utf-8')
+                            for name, content in reports.items()
+                        }
                         st.session_state['parsed_edi'] = parsed_edi
 
                     except Exception as e:
@@ -203,7 +462,7 @@ def main():
         # Display results if available
         if 'validation_result' in st.session_state:
             result = st.session_state['validation_result']
-            generator = st.session_state['report_generator']
+            reports = st.session_state['reports']
 
             # Compliance status
             if result.is_compliant():
@@ -227,95 +486,17 @@ def main():
 
             with tab1:
                 st.subheader("Validation Dashboard")
-                dashboard = generator.generate_dashboard()
-                st.code(dashboard, language="text")
+                st.code(reports["dashboard"], language="text")
 
             with tab2:
                 st.subheader("Detailed Text Report")
-                text_report = generator.generate_text_report()
-                st.text_area("Report Content", text_report, height=400)
+                st.text_area("Report Content", reports["text"], height=400)
 
             with tab3:
-                st.subheader("Issues List")
-
-                if result.total_issues() > 0:
-                    issues = result.get_all_issues()
-
-                    # Filter by severity
-                    severity_filter = st.multiselect(
-                        "Filter by severity",
-                        options=["ERROR", "WARNING", "INFO"],
-                        default=["ERROR", "WARNING", "INFO"]
-                    )
-
-                    filtered_issues = [i for i in issues if i.severity in severity_filter]
-
-                    st.write(f"Showing {len(filtered_issues)} of {len(issues)} issues")
-
-                    # Display issues
-                    for idx, issue in enumerate(filtered_issues, 1):
-                        severity_color = {
-                            "ERROR": "🔴",
-                            "WARNING": "🟡",
-                            "INFO": "🔵"
-                        }.get(issue.severity, "⚪")
-
-                        with st.expander(f"{severity_color} Issue #{idx} - {issue.severity} - Line {issue.line_number or 'N/A'}"):
-                            st.write(f"**Rule:** {issue.rule_id}")
-                            st.write(f"**Segment:** {issue.segment_id or 'N/A'}")
-                            st.write(f"**Message:** {issue.message}")
-
-                            if issue.expected_value:
-                                st.write(f"**Expected:** {issue.expected_value}")
-                            if issue.actual_value:
-                                st.write(f"**Actual:** {issue.actual_value}")
-                else:
-                    st.success("✅ No issues found - document is fully compliant!")
+                render_issues_tab(result)
 
             with tab4:
-                st.subheader("Download Reports")
-
-                col_d1, col_d2 = st.columns(2)
-
-                with col_d1:
-                    # Text report download
-                    text_report = generator.generate_text_report()
-                    st.download_button(
-                        label="📄 Download Text Report",
-                        data=text_report,
-                        file_name=f"validation_report_{doc_type}.txt",
-                        mime="text/plain"
-                    )
-
-                    # JSON report download
-                    json_report = generator.generate_json_report()
-                    st.download_button(
-                        label="📊 Download JSON Report",
-                        data=json_report,
-                        file_name=f"validation_report_{doc_type}.json",
-                        mime="application/json"
-                    )
-
-                with col_d2:
-                    # CSV report download
-                    csv_report = generator.generate_csv_report()
-                    st.download_button(
-                        label="📈 Download CSV Report",
-                        data=csv_report,
-                        file_name=f"validation_report_{doc_type}.csv",
-                        mime="text/csv"
-                    )
-
-                    # Dashboard download
-                    dashboard = generator.generate_dashboard()
-                    st.download_button(
-                        label="📋 Download Dashboard",
-                        data=dashboard,
-                        file_name=f"validation_dashboard_{doc_type}.txt",
-                        mime="text/plain"
-                    )
-
-                st.info("💡 All reports are available for download in multiple formats")
+                render_downloads_tab(st.session_state['download_blobs'], doc_type)
 
         else:
             st.info("👆 Configure settings and click 'Run Validation' to see results")
@@ -10,7 +10,11 @@ Each error includes:
 - Human-readable message
 """
 
-from typing import List, Dict, Optional
+import sys
+import time
+from collections import Counter
+from itertools import chain
+from typing import Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
 
@@ -19,6 +23,21 @@ class ValidationError:
     Represents a single validation error.
     """
 
+    # Validators can emit thousands of errors per document; slots drop the
+    # per-instance __dict__
+    __slots__ = (
+        "rule_id",
+        "severity",
+        "message",
+        "segment_id",
+        "line_number",
+        "element_position",
+        "expected_value",
+        "actual_value",
+        "context",
+        "_created"
+    )
+
     def __init__(
         self,
         rule_id: str,
@@ -45,16 +64,26 @@ class ValidationError:
             actual_value: What was found
             context: Additional context information
         """
-        self.rule_id = rule_id
-        self.severity = severity.upper()
+        # These come from small closed sets (three severities, the loaded
+        # rule IDs, X12 segment IDs); interning shares one string per value
+        # instead of keeping a fresh copy per error
+        self.rule_id = sys.intern(rule_id)
+        self.severity = sys.intern(severity.upper())
         self.message = message
-        self.segment_id = segment_id
+        self.segment_id = sys.intern(segment_id) if segment_id else segment_id
         self.line_number = line_number
         self.element_position = element_position
         self.expected_value = expected_value
         self.actual_value = actual_value
         self.context = context or {}
-        self.timestamp = datetime.now()
+        # Raw epoch seconds; time.time() is several times cheaper than
+        # datetime.now(), and the datetime is only built if asked for
+        self._created = time.time()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local time at which the error was created."""
+        return datetime.fromtimestamp(self._created)
 
     def to_dict(self) -> Dict:
         """
@@ -89,11 +118,46 @@ class ErrorCollector:
     Provides methods to add errors and generate statistics.
     """
 
-    def __init__(self):
-        """Initialize the error collector."""
+    def __init__(self, collect_info: bool = True):
+        """
+        Initialize the error collector.
+
+        Args:
+            collect_info: Whether INFO-level issues are recorded; when False
+                they are dropped before a ValidationError is built
+        """
+        self.collect_info = collect_info
         self.errors: List[ValidationError] = []
         self.warnings: List[ValidationError] = []
         self.info: List[ValidationError] = []
+        self._reset_counts()
+
+        # Bumped on every mutation; get_statistics() is memoized against it
+        self._version = 0
+        self._stats_cache: Optional[Tuple[int, Dict]] = None
+
+    def set_collect_info(self, collect_info: bool) -> None:
+        """
+        Enable or disable recording of INFO-level issues.
+
+        Only affects issues added afterwards.
+
+        Args:
+            collect_info: Whether INFO-level issues are recorded
+        """
+        self.collect_info = collect_info
+
+    def _reset_counts(self) -> None:
+        """Reset the running counts and the segment/line lookup indices."""
+        # One Counter per severity list; merged in ERROR, WARNING, INFO order
+        # so key order matches a scan of get_all_errors()
+        self._segment_counts = (Counter(), Counter(), Counter())
+        self._rule_counts = (Counter(), Counter(), Counter())
+
+        # Key -> ([errors], [warnings], [info]), so lookups return errors in
+        # the same order as filtering get_all_errors()
+        self._by_segment: Dict[Optional[str], Tuple[List, List, List]] = {}
+        self._by_line: Dict[Optional[int], Tuple[List, List, List]] = {}
 
     def add_error(
         self,
@@ -121,6 +185,9 @@ class ErrorCollector:
             actual_value: Actual value
             context: Additional context
         """
+        if not self.collect_info and severity.upper() == "INFO":
+            return
+
         error = ValidationError(
             rule_id=rule_id,
             severity=severity,
@@ -134,12 +201,33 @@ class ErrorCollector:
         )
 
         # Add to appropriate list
-        if severity.upper() == "ERROR":
+        if error.severity == "ERROR":
             self.errors.append(error)
-        elif severity.upper() == "WARNING":
+            bucket = 0
+        elif error.severity == "WARNING":
             self.warnings.append(error)
+            bucket = 1
         else:
             self.info.append(error)
+            bucket = 2
+
+        # Keep the statistics columns current so get_statistics needn't rescan
+        if segment_id:
+            self._segment_counts[bucket][segment_id] += 1
+        self._rule_counts[bucket][rule_id] += 1
+
+        # Index for get_errors_by_segment / get_errors_by_line
+        by_segment = self._by_segment.get(segment_id)
+        if by_segment is None:
+            by_segment = self._by_segment[segment_id] = ([], [], [])
+        by_segment[bucket].append(error)
+
+        by_line = self._by_line.get(line_number)
+        if by_line is None:
+            by_line = self._by_line[line_number] = ([], [], [])
+        by_line[bucket].append(error)
+
+        self._version += 1
 
     def get_all_errors(self) -> List[ValidationError]:
         """
@@ -150,6 +238,10 @@ class ErrorCollector:
         """
         return self.errors + self.warnings + self.info
 
+    def _iter_all_errors(self) -> Iterator[ValidationError]:
+        """Iterate over all errors in get_all_errors() order without building a list."""
+        return chain(self.errors, self.warnings, self.info)
+
     def get_errors_by_severity(self, severity: str) -> List[ValidationError]:
         """
         Get errors of a specific severity.
@@ -179,10 +271,8 @@ class ErrorCollector:
         Returns:
             List of errors for this segment
         """
-        return [
-            error for error in self.get_all_errors()
-            if error.segment_id == segment_id
-        ]
+        errors, warnings, info = self._by_segment.get(segment_id, ((), (), ()))
+        return [*errors, *warnings, *info]
 
     def get_errors_by_line(self, line_number: int) -> List[ValidationError]:
         """
@@ -194,10 +284,8 @@ class ErrorCollector:
         Returns:
             List of errors for this line
         """
-        return [
-            error for error in self.get_all_errors()
-            if error.line_number == line_number
-        ]
+        errors, warnings, info = self._by_line.get(line_number, ((), (), ()))
+        return [*errors, *warnings, *info]
 
     def has_errors(self) -> bool:
         """
@@ -221,11 +309,33 @@ class ErrorCollector:
         """
         Get error statistics.
 
+        The counts are cached until the next add_error() or clear(); each
+        caller gets its own copy, so changing it cannot affect later reports.
+
         Returns:
             Dictionary with error counts and breakdown
         """
-        all_errors = self.get_all_errors()
+        cached = self._stats_cache
+        if cached is None or cached[0] != self._version:
+            cached = self._stats_cache = (self._version, self._compute_statistics())
+
+        # Copying is O(distinct segment and rule IDs), not O(errors)
+        stats = cached[1]
+        return {
+            "total_errors": stats["total_errors"],
+            "by_severity": dict(stats["by_severity"]),
+            "by_segment": dict(stats["by_segment"]),
+            "by_rule": dict(stats["by_rule"]),
+            "is_compliant": stats["is_compliant"]
+        }
+
+    def _compute_statistics(self) -> Dict:
+        """
+        Build the error statistics from the running per-severity counts.
 
+        Returns:
+            Dictionary with error counts and breakdown
+        """
         # Count by severity
         severity_counts = {
             "ERROR": len(self.errors),
@@ -233,25 +343,27 @@ class ErrorCollector:
             "INFO": len(self.info)
         }
 
-        # Count by segment
+        # Count by segment and by rule, from the running per-severity counts
         segment_counts = {}
-        for error in all_errors:
-            if error.segment_id:
-                segment_counts[error.segment_id] = segment_counts.get(error.segment_id, 0) + 1
+        for counts in self._segment_counts:
+            for segment_id, count in counts.items():
+                segment_counts[segment_id] = segment_counts.get(segment_id, 0) + count
 
-        # Count by rule
         rule_counts = {}
-        for error in all_errors:
-            rule_counts[error.rule_id] = rule_counts.get(error.rule_id, 0) + 1
+        for counts in self._rule_counts:
+            for rule_id, count in counts.items():
+                rule_counts[rule_id] = rule_counts.get(rule_id, 0) + count
 
-        return {
-            "total_errors": len(all_errors),
+        stats = {
+            "total_errors": len(self.errors) + len(self.warnings) + len(self.info),
             "by_severity": severity_counts,
             "by_segment": segment_counts,
             "by_rule": rule_counts,
             "is_compliant": len(self.errors) == 0
         }
 
+        return stats
+
     def to_dict(self) -> Dict:
         """
         Convert all errors to dictionary format.
@@ -261,7 +373,7 @@ class ErrorCollector:
         """
         return {
             "statistics": self.get_statistics(),
-            "errors": [error.to_dict() for error in self.get_all_errors()]
+            "errors": [error.to_dict() for error in self._iter_all_errors()]
         }
 
     def clear(self) -> None:
@@ -269,10 +381,12 @@ class ErrorCollector:
         self.errors = []
         self.warnings = []
         self.info = []
+        self._reset_counts()
+        self._version += 1
 
     def __len__(self) -> int:
         """Return total number of errors (all severities)."""
-        return len(self.get_all_errors())
+        return len(self.errors) + len(self.warnings) + len(self.info)
 
     def __repr__(self) -> str:
         """String representation of collector."""
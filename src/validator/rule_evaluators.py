@@ -9,10 +9,122 @@ Contains validator functions for each rule category:
 """
 
 import re
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Pattern
 from .error_collector import ErrorCollector
 
 
+# Predicate over a segment's element list
+ElementPredicate = Callable[[List[str]], bool]
+
+# Segments grouped by segment ID, each list in document order. Segments are
+# EDIParser dicts, which always have "line", "segment_id" and "elements"
+SegmentIndex = Dict[str, List[Dict]]
+
+# Most segments scanned after a trigger when looking for a within_loop
+# rule's required segments
+LOOP_SCAN_LIMIT = 11
+
+@lru_cache(maxsize=256)
+def _compile_pattern(regex: str) -> Pattern:
+    """
+    Return the compiled form of a rule's regex, memoized by pattern string.
+
+    Args:
+        regex: Regular expression from a rule's validations
+
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(regex)
+
+
+def index_segments(segments: List[Dict]) -> SegmentIndex:
+    """
+    Group segments by segment ID in a single pass.
+
+    Validators look up the segments a rule targets instead of scanning the
+    whole document once per rule.
+
+    Args:
+        segments: List of parsed segments
+
+    Returns:
+        Dictionary of segment ID -> segments with that ID, in document order
+    """
+    by_id: SegmentIndex = {}
+    for segment in segments:
+        by_id.setdefault(segment["segment_id"], []).append(segment)
+    return by_id
+
+
+def _never(elements: List[str]) -> bool:
+    """Predicate for conditions that can never be met."""
+    return False
+
+
+def compile_element_conditional(conditional: Dict) -> ElementPredicate:
+    """
+    Compile an element rule's "conditional" into a predicate.
+
+    The rule is inspected once, so checking a segment is a bounds check and a
+    comparison instead of re-reading and converting the rule every time.
+
+    Args:
+        conditional: Conditional specification ({"if_element", "equals"})
+
+    Returns:
+        Function taking a segment's elements, True if the conditional is met
+    """
+    if_element = conditional.get("if_element")
+    if not if_element:
+        return _never
+
+    position = int(if_element)
+    equals = conditional.get("equals")
+
+    def predicate(elements: List[str]) -> bool:
+        return position < len(elements) and elements[position].strip() == equals
+
+    return predicate
+
+
+def compile_condition(condition: Dict) -> ElementPredicate:
+    """
+    Compile a conditional rule's "condition" into a predicate.
+
+    Specializes on which of if_value / if_value_exists the rule uses, so the
+    per-segment check carries no rule-shape branching.
+
+    Args:
+        condition: Condition specification ({"if_element", "if_value",
+            "if_value_exists"}); if_segment is matched by the caller
+
+    Returns:
+        Function taking a segment's elements, True if the condition is met
+    """
+    if_element = condition.get("if_element")
+    if_value = condition.get("if_value")
+    if_value_exists = condition.get("if_value_exists")
+
+    if not if_element or not (if_value or if_value_exists):
+        return _never
+
+    position = int(if_element)
+
+    if if_value_exists:
+        # A non-empty value satisfies "exists", and any match on a
+        # (non-empty) if_value is non-empty too
+        def predicate(elements: List[str]) -> bool:
+            return position < len(elements) and bool(elements[position].strip())
+    else:
+        def predicate(elements: List[str]) -> bool:
+            return position < len(elements) and elements[position].strip() == if_value
+
+    return predicate
+
+
 class RequiredSegmentValidator:
     """Validates required segment rules."""
 
@@ -25,97 +137,140 @@ class RequiredSegmentValidator:
         """
         self.error_collector = error_collector
 
-    def validate(self, parsed_edi: Dict, rules: List[Dict]) -> None:
+    def validate(
+        self, parsed_edi: Dict, rules: List[Dict], segments_by_id: Optional[SegmentIndex] = None
+    ) -> None:
         """
         Validate required segment rules.
 
         Args:
             parsed_edi: Parsed EDI document
             rules: List of required segment rules
+            segments_by_id: Optional index from index_segments(), built if not given
         """
-        segments = parsed_edi.get("segments", [])
+        if segments_by_id is None:
+            segments_by_id = index_segments(parsed_edi.get("segments", []))
 
         for rule in rules:
             segment_id = rule.get("segment_id")
-            min_occurrences = rule.get("min_occurrences", 0)
             max_occurrences = rule.get("max_occurrences")
             element_filters = rule.get("element_filters", {})
 
             # Count matching segments
             matching_segments = self._find_matching_segments(
-                segments, segment_id, element_filters
+                segments_by_id, segment_id, element_filters
             )
             count = len(matching_segments)
 
-            # Check minimum occurrences
-            if count < min_occurrences:
-                self.error_collector.add_error(
-                    rule_id=rule["rule_id"],
-                    severity=rule["severity"],
-                    message=f"{rule['description']} (found {count}, expected at least {min_occurrences})",
-                    segment_id=segment_id,
-                    expected_value=f"min {min_occurrences}",
-                    actual_value=str(count)
-                )
+            # Report on the first excess segment
+            excess_line = None
+            if max_occurrences is not None and count > max_occurrences and count > 0:
+                excess_line = matching_segments[max_occurrences]["line"]
 
-            # Check maximum occurrences
-            if max_occurrences is not None and count > max_occurrences:
-                # Report on the first excess segment
-                if count > 0:
-                    excess_segment = matching_segments[max_occurrences]
-                    line_number = excess_segment.get("line")
-                else:
-                    line_number = None
+            self._check_occurrences(rule, count, excess_line)
 
-                self.error_collector.add_error(
-                    rule_id=rule["rule_id"],
-                    severity=rule["severity"],
-                    message=f"{segment_id} appears too many times (found {count}, max {max_occurrences})",
-                    segment_id=segment_id,
-                    line_number=line_number,
-                    expected_value=f"max {max_occurrences}",
-                    actual_value=str(count)
-                )
+    def _check_occurrences(self, rule: Dict, count: int, excess_line: Optional[int]) -> None:
+        """
+        Report a required segment rule whose occurrence count is out of range.
+
+        Args:
+            rule: Rule dictionary
+            count: Number of segments matching the rule
+            excess_line: Line of the first segment past max_occurrences, if any
+        """
+        segment_id = rule.get("segment_id")
+        min_occurrences = rule.get("min_occurrences", 0)
+        max_occurrences = rule.get("max_occurrences")
+
+        # Check minimum occurrences
+        if count < min_occurrences:
+            self.error_collector.add_error(
+                rule_id=rule["rule_id"],
+                severity=rule["severity"],
+                message=f"{rule['description']} (found {count}, expected at least {min_occurrences})",
+                segment_id=segment_id,
+                expected_value=f"min {min_occurrences}",
+                actual_value=str(count)
+            )
+
+        # Check maximum occurrences
+        if max_occurrences is not None and count > max_occurrences:
+            self.error_collector.add_error(
+                rule_id=rule["rule_id"],
+                severity=rule["severity"],
+                message=f"{segment_id} appears too many times (found {count}, max {max_occurrences})",
+                segment_id=segment_id,
+                line_number=excess_line,
+                expected_value=f"max {max_occurrences}",
+                actual_value=str(count)
+            )
 
     def _find_matching_segments(
-        self, segments: List[Dict], segment_id: str, element_filters: Dict
+        self, segments_by_id: SegmentIndex, segment_id: str, element_filters: Dict
     ) -> List[Dict]:
         """
         Find segments matching ID and optional element filters.
 
         Args:
-            segments: List of parsed segments
+            segments_by_id: Segments grouped by segment ID
             segment_id: Segment ID to match
             element_filters: Dictionary of element position -> required value
 
         Returns:
-            List of matching segments
+            List of matching segments; without filters this is the index's
+            own list, which must not be modified
         """
-        matching = []
-
-        for segment in segments:
-            if segment["segment_id"] != segment_id:
-                continue
+        candidates = segments_by_id.get(segment_id, [])
 
-            # Check element filters
-            if element_filters:
-                elements = segment.get("elements", [])
-                matches_filters = True
+        # The common unfiltered rule needs no scan or copy at all
+        if not element_filters or not candidates:
+            return candidates
 
-                for position, required_value in element_filters.items():
-                    position = int(position)
-                    if position >= len(elements) or elements[position] != required_value:
-                        matches_filters = False
-                        break
+        # Convert filter positions once per rule, not once per segment
+        filters = [(int(position), value) for position, value in element_filters.items()]
+        matching = []
 
-                if matches_filters:
-                    matching.append(segment)
+        for segment in candidates:
+            elements = segment["elements"]
+            for position, required_value in filters:
+                if position >= len(elements) or elements[position] != required_value:
+                    break
             else:
                 matching.append(segment)
 
         return matching
 
 
+class _ElementChecks:
+    """An element rule's validations, read once per rule instead of per segment."""
+
+    __slots__ = (
+        "required",
+        "min_length",
+        "max_length",
+        "allowed_values",
+        "allowed_set",
+        "regex",
+        "pattern"
+    )
+
+    def __init__(self, validations: Dict):
+        """
+        Extract validation criteria from a rule.
+
+        Args:
+            validations: The rule's "validations" dictionary
+        """
+        self.required = validations.get("required")
+        self.min_length = validations.get("min_length")
+        self.max_length = validations.get("max_length")
+        # The list is kept for messages; membership checks use the set
+        self.allowed_values = validations.get("allowed_values")
+        self.allowed_set = frozenset(self.allowed_values) if self.allowed_values else None
+        self.regex = validations.get("regex")
+        self.pattern = _compile_pattern(self.regex) if self.regex else None
+
+
 class ElementValidator:
     """Validates element-level rules."""
 
@@ -128,77 +283,84 @@ class ElementValidator:
         """
         self.error_collector = error_collector
 
-    def validate(self, parsed_edi: Dict, rules: List[Dict]) -> None:
+    def validate(
+        self, parsed_edi: Dict, rules: List[Dict], segments_by_id: Optional[SegmentIndex] = None
+    ) -> None:
         """
         Validate element rules.
 
         Args:
             parsed_edi: Parsed EDI document
             rules: List of element validation rules
+            segments_by_id: Optional index from index_segments(), built if not given
         """
-        segments = parsed_edi.get("segments", [])
+        if segments_by_id is None:
+            segments_by_id = index_segments(parsed_edi.get("segments", []))
 
         for rule in rules:
             segment_id = rule.get("segment_id")
+
+            # Nothing to check (or compile) for segments the document lacks
+            if segment_id not in segments_by_id:
+                continue
+
             element_position = int(rule.get("element_position", 0))
-            validations = rule.get("validations", {})
+            checks = _ElementChecks(rule.get("validations", {}))
             conditional = rule.get("conditional", {})
+            applies = compile_element_conditional(conditional) if conditional else None
+
+            # Bound once per rule for the inlined pass check below
+            required = checks.required
+            min_length = checks.min_length
+            max_length = checks.max_length
+            allowed_set = checks.allowed_set
+            pattern = checks.pattern
 
-            # Find matching segments
-            matching_segments = [s for s in segments if s["segment_id"] == segment_id]
+            for segment in segments_by_id.get(segment_id, ()):
+                # Parsed segments always carry "elements"; a plain subscript
+                # is about twice as fast as .get() with a default
+                elements = segment["elements"]
 
-            for segment in matching_segments:
                 # Check if conditional applies
-                if conditional and not self._check_conditional(segment, conditional):
+                if applies is not None and not applies(elements):
                     continue
 
-                elements = segment.get("elements", [])
-
                 # Check if element exists
                 if element_position >= len(elements):
-                    if validations.get("required"):
+                    if required:
                         self.error_collector.add_error(
                             rule_id=rule["rule_id"],
                             severity=rule["severity"],
                             message=f"{segment_id}{element_position:02d} is required but missing",
                             segment_id=segment_id,
-                            line_number=segment.get("line"),
+                            line_number=segment["line"],
                             element_position=element_position
                         )
                     continue
 
                 element_value = elements[element_position].strip()
 
+                # Inlined fast path: most values pass every check, so only
+                # failing (or required-but-empty) values pay for the call
+                if element_value:
+                    length = len(element_value)
+                    if (
+                        (not min_length or length >= min_length)
+                        and (not max_length or length <= max_length)
+                        and (allowed_set is None or element_value in allowed_set)
+                        and (pattern is None or pattern.match(element_value))
+                    ):
+                        continue
+                elif not required:
+                    continue
+
                 # Validate the element
                 self._validate_element_value(
-                    rule, segment, element_position, element_value, validations
+                    rule, segment, element_position, element_value, checks
                 )
 
-    def _check_conditional(self, segment: Dict, conditional: Dict) -> bool:
-        """
-        Check if conditional criteria are met.
-
-        Args:
-            segment: Segment dictionary
-            conditional: Conditional specification
-
-        Returns:
-            True if conditional is met
-        """
-        if_element = conditional.get("if_element")
-        equals = conditional.get("equals")
-
-        if if_element:
-            elements = segment.get("elements", [])
-            if_element_pos = int(if_element)
-
-            if if_element_pos < len(elements):
-                return elements[if_element_pos].strip() == equals
-
-        return False
-
     def _validate_element_value(
-        self, rule: Dict, segment: Dict, position: int, value: str, validations: Dict
+        self, rule: Dict, segment: Dict, position: int, value: str, checks: _ElementChecks
     ) -> None:
         """
         Validate an element value against validation criteria.
@@ -208,13 +370,13 @@ class ElementValidator:
             segment: Segment dictionary
             position: Element position
             value: Element value
-            validations: Validation criteria
+            checks: Validation criteria extracted from the rule
         """
         segment_id = segment["segment_id"]
-        line_number = segment.get("line")
+        line_number = segment["line"]
 
         # Check if required but empty
-        if validations.get("required") and not value:
+        if checks.required and not value:
             self.error_collector.add_error(
                 rule_id=rule["rule_id"],
                 severity=rule["severity"],
@@ -227,12 +389,12 @@ class ElementValidator:
             return
 
         # Skip further validation if empty and not required
-        if not value and not validations.get("required"):
+        if not value and not checks.required:
             return
 
         # Check length
-        min_length = validations.get("min_length")
-        max_length = validations.get("max_length")
+        min_length = checks.min_length
+        max_length = checks.max_length
 
         if min_length and len(value) < min_length:
             self.error_collector.add_error(
@@ -259,8 +421,8 @@ class ElementValidator:
             )
 
         # Check allowed values
-        allowed_values = validations.get("allowed_values")
-        if allowed_values and value not in allowed_values:
+        allowed_values = checks.allowed_values
+        if allowed_values and value not in checks.allowed_set:
             self.error_collector.add_error(
                 rule_id=rule["rule_id"],
                 severity=rule["severity"],
@@ -273,8 +435,8 @@ class ElementValidator:
             )
 
         # Check regex pattern
-        regex = validations.get("regex")
-        if regex and not re.match(regex, value):
+        regex = checks.regex
+        if regex and not checks.pattern.match(value):
             self.error_collector.add_error(
                 rule_id=rule["rule_id"],
                 severity=rule["severity"],
@@ -287,6 +449,41 @@ class ElementValidator:
             )
 
 
+class _ThenClause:
+    """A conditional rule's "then" requirements, read once per rule instead of per trigger."""
+
+    __slots__ = (
+        "required_segments",
+        "within_loop",
+        "message",
+        "element_segment",
+        "element_position"
+    )
+
+    def __init__(self, then_clause: Dict, trigger_segment_id: Optional[str]):
+        """
+        Extract the requirements from a rule's "then" clause.
+
+        Args:
+            then_clause: The rule's "then" dictionary
+            trigger_segment_id: Segment ID that triggers the rule (if_segment)
+        """
+        self.required_segments = then_clause.get("required_segments", [])
+        self.within_loop = then_clause.get("within_loop")
+        self.message = then_clause.get("message")
+
+        # A required element is only checked on the trigger itself, whose
+        # segment ID is fixed per rule, so a mismatch rules it out up front
+        self.element_segment = None
+        self.element_position = None
+        required_element = then_clause.get("required_element")
+        if required_element:
+            position = int(required_element.get("element", 0))
+            if required_element.get("segment") == trigger_segment_id:
+                self.element_segment = trigger_segment_id
+                self.element_position = position
+
+
 class ConditionalRuleValidator:
     """Validates conditional (if-then) rules."""
 
@@ -299,52 +496,58 @@ class ConditionalRuleValidator:
         """
         self.error_collector = error_collector
 
-    def validate(self, parsed_edi: Dict, rules: List[Dict]) -> None:
+    def validate(
+        self, parsed_edi: Dict, rules: List[Dict], segments_by_id: Optional[SegmentIndex] = None
+    ) -> None:
         """
         Validate conditional rules.
 
         Args:
             parsed_edi: Parsed EDI document
             rules: List of conditional rules
+            segments_by_id: Optional index from index_segments(), built if not given
         """
         segments = parsed_edi.get("segments", [])
-
-        for rule in rules:
+        if segments_by_id is None:
+            segments_by_id = index_segments(segments)
+
+        # Rules whose trigger segment never occurs cannot fire
+        active_rules = [
+            rule for rule in rules
+            if rule.get("condition", {}).get("if_segment") in segments_by_id
+        ]
+
+        # Line numbers in list order, so within_loop scans can bisect to the
+        # trigger; None if no rule needs them or segments are out of order
+        lines = None
+        if any(rule.get("then", {}).get("within_loop") for rule in active_rules):
+            lines = [seg["line"] for seg in segments]
+            if any(a > b for a, b in zip(lines, lines[1:])):
+                lines = None
+
+        for rule in active_rules:
             condition = rule.get("condition", {})
-            then_clause = rule.get("then", {})
-
             # Find segments that match the condition
             if_segment_id = condition.get("if_segment")
-            if_element = condition.get("if_element")
-            if_value = condition.get("if_value")
-            if_value_exists = condition.get("if_value_exists")
-
-            for segment in segments:
-                if segment["segment_id"] != if_segment_id:
-                    continue
+            condition_met = compile_condition(condition)
+            then_clause = _ThenClause(rule.get("then", {}), if_segment_id)
 
+            for segment in segments_by_id.get(if_segment_id, ()):
                 # Check if condition is met
-                elements = segment.get("elements", [])
-                if_element_pos = int(if_element) if if_element else None
-
-                condition_met = False
-
-                if if_element_pos is not None and if_element_pos < len(elements):
-                    element_value = elements[if_element_pos].strip()
-
-                    if if_value and element_value == if_value:
-                        condition_met = True
-                    elif if_value_exists and element_value:
-                        condition_met = True
-
-                if condition_met:
+                if condition_met(segment["elements"]):
                     # Check "then" requirements
                     self._check_then_clause(
-                        rule, segment, segments, then_clause
+                        rule, segment, segments, then_clause, segments_by_id, lines
                     )
 
     def _check_then_clause(
-        self, rule: Dict, trigger_segment: Dict, all_segments: List[Dict], then_clause: Dict
+        self,
+        rule: Dict,
+        trigger_segment: Dict,
+        all_segments: List[Dict],
+        then_clause: _ThenClause,
+        segments_by_id: SegmentIndex,
+        lines: Optional[List[int]] = None
     ) -> None:
         """
         Check if "then" clause requirements are met.
@@ -353,37 +556,45 @@ class ConditionalRuleValidator:
             rule: Rule dictionary
             trigger_segment: Segment that triggered the condition
             all_segments: All segments in the document
-            then_clause: Then clause specification
+            then_clause: Then clause requirements extracted from the rule
+            segments_by_id: Segments grouped by segment ID
+            lines: Line number of each segment in all_segments, if sorted
         """
-        required_segments = then_clause.get("required_segments", [])
-        within_loop = then_clause.get("within_loop")
-        required_element = then_clause.get("required_element")
-        message_override = then_clause.get("message")
+        required_segments = then_clause.required_segments
+        within_loop = then_clause.within_loop
+        message_override = then_clause.message
 
         # Check for required segments
         if required_segments:
-            trigger_line = trigger_segment.get("line")
+            trigger_line = trigger_segment["line"]
 
             # Find segments in the same loop (simple implementation: next few segments)
-            loop_segments = []
             if within_loop:
+                if lines is not None:
+                    # Sorted by line: jump past the trigger; the safety limit
+                    # below never looks at more than LOOP_SCAN_LIMIT segments
+                    start = bisect_right(lines, trigger_line)
+                    following = all_segments[start:start + LOOP_SCAN_LIMIT]
+                else:
+                    following = (seg for seg in all_segments if seg["line"] > trigger_line)
+
+                loop_segments = []
                 # Get segments following the trigger until we hit a different loop
-                for seg in all_segments:
-                    if seg.get("line", 0) > trigger_line:
-                        if seg["segment_id"] == within_loop:
-                            # New loop started
-                            break
-                        loop_segments.append(seg)
-                        if len(loop_segments) > 10:  # Safety limit
-                            break
+                for seg in following:
+                    if seg["segment_id"] == within_loop:
+                        # New loop started
+                        break
+                    loop_segments.append(seg)
+                    if len(loop_segments) >= LOOP_SCAN_LIMIT:  # Safety limit
+                        break
+                present_ids = {seg["segment_id"] for seg in loop_segments}
             else:
-                loop_segments = all_segments
+                # Anywhere in the document: the index has every segment ID
+                present_ids = segments_by_id
 
             # Check each required segment
             for req_seg_id in required_segments:
-                found = any(s["segment_id"] == req_seg_id for s in loop_segments)
-
-                if not found:
+                if req_seg_id not in present_ids:
                     message = message_override or f"{req_seg_id} is required when {trigger_segment['segment_id']} is present"
                     self.error_collector.add_error(
                         rule_id=rule["rule_id"],
@@ -395,22 +606,20 @@ class ConditionalRuleValidator:
                     )
 
         # Check for required element
-        if required_element:
-            req_seg_id = required_element.get("segment")
-            req_elem_pos = int(required_element.get("element", 0))
-
-            if req_seg_id == trigger_segment["segment_id"]:
-                elements = trigger_segment.get("elements", [])
-                if req_elem_pos >= len(elements) or not elements[req_elem_pos].strip():
-                    message = message_override or f"{req_seg_id}{req_elem_pos:02d} is required"
-                    self.error_collector.add_error(
-                        rule_id=rule["rule_id"],
-                        severity=rule["severity"],
-                        message=message,
-                        segment_id=req_seg_id,
-                        line_number=trigger_segment.get("line"),
-                        element_position=req_elem_pos
-                    )
+        req_seg_id = then_clause.element_segment
+        if req_seg_id is not None:
+            req_elem_pos = then_clause.element_position
+            elements = trigger_segment["elements"]
+            if req_elem_pos >= len(elements) or not elements[req_elem_pos].strip():
+                message = message_override or f"{req_seg_id}{req_elem_pos:02d} is required"
+                self.error_collector.add_error(
+                    rule_id=rule["rule_id"],
+                    severity=rule["severity"],
+                    message=message,
+                    segment_id=req_seg_id,
+                    line_number=trigger_segment["line"],
+                    element_position=req_elem_pos
+                )
 
 
 class CrossSegmentValidator:
@@ -425,50 +634,73 @@ class CrossSegmentValidator:
         """
         self.error_collector = error_collector
 
-    def validate(self, parsed_edi: Dict, rules: List[Dict]) -> None:
+    def validate(
+        self, parsed_edi: Dict, rules: List[Dict], segments_by_id: Optional[SegmentIndex] = None
+    ) -> None:
         """
         Validate cross-segment rules.
 
         Args:
             parsed_edi: Parsed EDI document
             rules: List of cross-segment rules
+            segments_by_id: Optional index from index_segments(), built if not given
         """
-        segments = parsed_edi.get("segments", [])
+        if segments_by_id is None:
+            segments_by_id = index_segments(parsed_edi.get("segments", []))
 
         for rule in rules:
             validation_logic = rule.get("validation_logic", {})
             validation_type = validation_logic.get("type")
 
             if validation_type == "count_match":
-                self._validate_count_match(rule, segments, validation_logic)
+                self._validate_count_match(rule, segments_by_id, validation_logic)
             elif validation_type == "element_match":
-                self._validate_element_match(rule, segments, validation_logic)
+                self._validate_element_match(rule, segments_by_id, validation_logic)
             elif validation_type == "element_value_exists":
-                self._validate_element_value_exists(rule, segments, validation_logic)
+                self._validate_element_value_exists(rule, segments_by_id, validation_logic)
 
     def _validate_count_match(
-        self, rule: Dict, segments: List[Dict], logic: Dict
+        self, rule: Dict, segments_by_id: SegmentIndex, logic: Dict
     ) -> None:
         """
         Validate that a segment's element value matches a count of another segment.
 
         Args:
             rule: Rule dictionary
-            segments: List of segments
+            segments_by_id: Segments grouped by segment ID
             logic: Validation logic specification
         """
         source_segment_id = logic.get("source_segment")
         target_segment_id = logic.get("target_segment")
-        target_element = int(logic.get("target_element", 0))
+
+        # Only declared counts are checked; no target segment, no check
+        if target_segment_id not in segments_by_id:
+            return
 
         # Count source segments
-        source_count = sum(1 for s in segments if s["segment_id"] == source_segment_id)
+        source_count = len(segments_by_id.get(source_segment_id, ()))
 
-        # Find target segment
-        target_segments = [s for s in segments if s["segment_id"] == target_segment_id]
+        self._check_declared_counts(
+            rule, logic, segments_by_id[target_segment_id], source_count
+        )
+
+    def _check_declared_counts(
+        self, rule: Dict, logic: Dict, target_segments: List[Dict], source_count: int
+    ) -> None:
+        """
+        Compare each target segment's declared count with the actual count.
+
+        Args:
+            rule: Rule dictionary
+            logic: Validation logic specification
+            target_segments: Segments declaring a count (target_segment)
+            source_count: Number of source segments in the document
+        """
+        target_segment_id = logic.get("target_segment")
+        target_element = int(logic.get("target_element", 0))
 
         for target_seg in target_segments:
-            elements = target_seg.get("elements", [])
+            elements = target_seg["elements"]
 
             if target_element < len(elements):
                 declared_count = elements[target_element].strip()
@@ -483,7 +715,7 @@ class CrossSegmentValidator:
                             severity=rule["severity"],
                             message=message,
                             segment_id=target_segment_id,
-                            line_number=target_seg.get("line"),
+                            line_number=target_seg["line"],
                             element_position=target_element,
                             expected_value=str(source_count),
                             actual_value=declared_count
@@ -495,85 +727,120 @@ class CrossSegmentValidator:
                         severity=rule["severity"],
                         message=f"{target_segment_id}{target_element:02d} contains invalid count value",
                         segment_id=target_segment_id,
-                        line_number=target_seg.get("line"),
+                        line_number=target_seg["line"],
                         element_position=target_element,
                         actual_value=declared_count
                     )
 
     def _validate_element_match(
-        self, rule: Dict, segments: List[Dict], logic: Dict
+        self, rule: Dict, segments_by_id: SegmentIndex, logic: Dict
     ) -> None:
         """
         Validate that element values match between segments.
 
         Args:
             rule: Rule dictionary
-            segments: List of segments
+            segments_by_id: Segments grouped by segment ID
             logic: Validation logic specification
         """
         match_pairs = logic.get("match_pairs", [])
 
         for pair in match_pairs:
-            seg1_id = pair.get("segment_1")
-            elem1_pos = int(pair.get("element_1", 0))
-            seg2_id = pair.get("segment_2")
-            elem2_pos = int(pair.get("element_2", 0))
-
             # Find segments
-            seg1_list = [s for s in segments if s["segment_id"] == seg1_id]
-            seg2_list = [s for s in segments if s["segment_id"] == seg2_id]
+            seg1_list = segments_by_id.get(pair.get("segment_1"), ())
+            seg2_list = segments_by_id.get(pair.get("segment_2"), ())
 
             for seg1, seg2 in zip(seg1_list, seg2_list):
-                elem1 = seg1.get("elements", [])
-                elem2 = seg2.get("elements", [])
+                self._check_element_pair(rule, pair, seg1, seg2)
 
-                if elem1_pos < len(elem1) and elem2_pos < len(elem2):
-                    val1 = elem1[elem1_pos].strip()
-                    val2 = elem2[elem2_pos].strip()
+    def _check_element_pair(self, rule: Dict, pair: Dict, seg1: Dict, seg2: Dict) -> None:
+        """
+        Check that one pair of segments has matching element values.
 
-                    if val1 != val2:
-                        self.error_collector.add_error(
-                            rule_id=rule["rule_id"],
-                            severity=rule["severity"],
-                            message=f"{seg1_id}{elem1_pos:02d} and {seg2_id}{elem2_pos:02d} must match",
-                            segment_id=seg2_id,
-                            line_number=seg2.get("line"),
-                            element_position=elem2_pos,
-                            expected_value=val1,
-                            actual_value=val2
-                        )
+        Args:
+            rule: Rule dictionary
+            pair: Match pair specification (segment_1/element_1, segment_2/element_2)
+            seg1: Occurrence of segment_1
+            seg2: Corresponding occurrence of segment_2
+        """
+        elem1_pos = int(pair.get("element_1", 0))
+        elem2_pos = int(pair.get("element_2", 0))
+        elem1 = seg1["elements"]
+        elem2 = seg2["elements"]
+
+        if elem1_pos < len(elem1) and elem2_pos < len(elem2):
+            val1 = elem1[elem1_pos].strip()
+            val2 = elem2[elem2_pos].strip()
+
+            if val1 != val2:
+                seg1_id = pair.get("segment_1")
+                seg2_id = pair.get("segment_2")
+                self.error_collector.add_error(
+                    rule_id=rule["rule_id"],
+                    severity=rule["severity"],
+                    message=f"{seg1_id}{elem1_pos:02d} and {seg2_id}{elem2_pos:02d} must match",
+                    segment_id=seg2_id,
+                    line_number=seg2["line"],
+                    element_position=elem2_pos,
+                    expected_value=val1,
+                    actual_value=val2
+                )
 
     def _validate_element_value_exists(
-        self, rule: Dict, segments: List[Dict], logic: Dict
+        self, rule: Dict, segments_by_id: SegmentIndex, logic: Dict
     ) -> None:
         """
         Validate that at least one segment has a specific element value.
 
         Args:
             rule: Rule dictionary
-            segments: List of segments
+            segments_by_id: Segments grouped by segment ID
             logic: Validation logic specification
         """
-        segment_id = logic.get("segment_id")
+        # Check if any segment has the required value
+        if not self._has_element_value(logic, segments_by_id.get(logic.get("segment_id"), ())):
+            self._report_missing_value(rule, logic)
+
+    @staticmethod
+    def _has_element_value(logic: Dict, segments: List[Dict]) -> bool:
+        """
+        Check whether any of the segments has the rule's required value.
+
+        Args:
+            logic: Validation logic specification
+            segments: Occurrences of the rule's segment_id
+
+        Returns:
+            True if an element_position value equals required_value
+        """
         element_position = int(logic.get("element_position", 0))
         required_value = logic.get("required_value")
 
-        # Check if any segment has the required value
-        found = False
         for segment in segments:
-            if segment["segment_id"] == segment_id:
-                elements = segment.get("elements", [])
-                if element_position < len(elements):
-                    if elements[element_position].strip() == required_value:
-                        found = True
-                        break
+            elements = segment["elements"]
+            if element_position < len(elements):
+                if elements[element_position].strip() == required_value:
+                    return True
 
-        if not found:
-            message = logic.get("message") or f"No {segment_id} segment with {segment_id}{element_position:02d}={required_value} found"
-            self.error_collector.add_error(
-                rule_id=rule["rule_id"],
-                severity=rule["severity"],
-                message=message,
-                segment_id=segment_id,
-                expected_value=required_value
-            )
+        return False
+
+    def _report_missing_value(self, rule: Dict, logic: Dict) -> None:
+        """
+        Report that no segment has the rule's required value.
+
+        Args:
+            rule: Rule dictionary
+            logic: Validation logic specification
+        """
+        segment_id = logic.get("segment_id")
+        element_position = int(logic.get("element_position", 0))
+        required_value = logic.get("required_value")
+
+        message = logic.get("message") or f"No {segment_id} segment with {segment_id}{element_position:02d}={required_value} found"
+        self.error_collector.add_error(
+            rule_id=rule["rule_id"],
+            severity=rule["severity"],
+            message=message,
+            segment_id=segment_id,
+            expected_value=required_value
+        )
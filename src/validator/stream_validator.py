@@ -0,0 +1,457 @@
+"""
+Streaming Validator Module
+
+Validates segments as they are produced by EDIParser.iter_parsed_segments(),
+holding a bounded window of the document instead of all of it.
+
+Segments are validated in fixed-size windows of consecutive segments:
+- Element rules and conditional triggers only need the segment itself;
+  within_loop scans also see the next LOOP_SCAN_LIMIT segments.
+- Required segment, count and value-exists checks keep running totals.
+- Rules that depend on the whole document keep only what is still
+  undecided: conditional triggers whose required segments have not been
+  seen yet, count targets, and element_match segments awaiting a partner.
+
+Each rule's issues are held until the end of the stream and then reported
+in the same order as ValidationEngine.validate().
+"""
+
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+from .error_collector import ErrorCollector
+from .rule_evaluators import (
+    RequiredSegmentValidator,
+    ElementValidator,
+    ConditionalRuleValidator,
+    CrossSegmentValidator,
+    LOOP_SCAN_LIMIT,
+    SegmentIndex,
+    compile_condition,
+    index_segments,
+    _ThenClause
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Segments validated together; peak memory is about this many parsed
+# segments (plus the within_loop lookahead)
+WINDOW_SIZE = 1024
+
+
+class _DeferredErrors:
+    """Stands in for an ErrorCollector, holding a rule's issues until the end."""
+
+    __slots__ = ("entries", "collect_info")
+
+    def __init__(self, collect_info: bool = True):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            collect_info: Whether INFO-level issues are kept
+        """
+        self.entries: List[Dict] = []
+        self.collect_info = collect_info
+
+    def add_error(self, **error) -> None:
+        """Record an issue; takes the keyword arguments of ErrorCollector.add_error."""
+        if not self.collect_info and error["severity"].upper() == "INFO":
+            return
+        self.entries.append(error)
+
+    def replay(self, error_collector: ErrorCollector) -> None:
+        """
+        Report the recorded issues, in the order they were added.
+
+        Args:
+            error_collector: Collector that receives the issues
+        """
+        for error in self.entries:
+            error_collector.add_error(**error)
+
+
+class _CategoryStream:
+    """
+    Streaming state for one rule category.
+
+    The category's rules are split into units (a rule, or one element_match
+    pair), each with its own validator and issue buffer. Subclasses add the
+    units and implement the per-unit steps.
+    """
+
+    # Category name, as used by ValidationEngine.validate()
+    name = ""
+
+    def __init__(self, collect_info: bool):
+        """
+        Initialize a category without units.
+
+        Args:
+            collect_info: Whether INFO-level issues are kept
+        """
+        self.collect_info = collect_info
+        self.units: List[list] = []
+        self.buffers: List[_DeferredErrors] = []
+        # Units before this index are still validated
+        self.active = 0
+        self.failure: Optional[str] = None
+
+    def _add_unit(self, validator_class, *state) -> None:
+        """
+        Add a unit, validated after those already added.
+
+        Args:
+            validator_class: Validator from rule_evaluators for the unit
+            *state: The unit's initial state, after its validator
+        """
+        buffer = _DeferredErrors(self.collect_info)
+        self.units.append([validator_class(buffer), *state])
+        self.buffers.append(buffer)
+        self.active += 1
+
+    def feed(self, window_index: SegmentIndex, context: List[Dict],
+             seen_ids: Dict[str, int]) -> None:
+        """
+        Validate one window of segments.
+
+        Args:
+            window_index: The window's segments grouped by segment ID
+            context: The window followed by its lookahead segments
+            seen_ids: Segment counts for everything read so far
+        """
+        index = 0
+        while index < self.active:
+            self._run(index, self._feed_unit, window_index, context, seen_ids)
+            index += 1
+
+    def finish(self, seen_ids: Dict[str, int]) -> None:
+        """
+        Decide what could only be decided once the whole document was seen.
+
+        Args:
+            seen_ids: Segment counts for the whole document
+        """
+        index = 0
+        while index < self.active:
+            self._run(index, self._finish_unit, seen_ids)
+            index += 1
+
+    def replay(self, error_collector: ErrorCollector) -> None:
+        """
+        Report the category's issues, then its system error if a unit failed.
+
+        Args:
+            error_collector: Collector that receives the issues
+        """
+        for buffer in self.buffers:
+            buffer.replay(error_collector)
+
+        if self.failure is not None:
+            error_collector.add_error(
+                rule_id="SYSTEM_ERROR",
+                severity="ERROR",
+                message=f"System error during {self.name} validation: {self.failure}"
+            )
+
+    def _run(self, index: int, step, *args) -> None:
+        """
+        Run one step of a unit, stopping the category where a unit fails.
+
+        A whole-document run stops a category at the first failing rule:
+        earlier rules have finished, later ones never run. So a failing
+        unit keeps what it reported before failing, later units are
+        dropped, and earlier units carry on.
+
+        Args:
+            index: Position of the unit
+            step: _feed_unit or _finish_unit
+            *args: Arguments for the step, after the unit
+        """
+        try:
+            step(self.units[index], *args)
+        except Exception as e:
+            logger.error(f"Error during {self.name} validation: {e}")
+            self.failure = str(e)
+            self.active = index
+            for buffer in self.buffers[index + 1:]:
+                buffer.entries.clear()
+
+    def _feed_unit(self, unit: list, window_index: SegmentIndex,
+                   context: List[Dict], seen_ids: Dict[str, int]) -> None:
+        """Validate one window for a unit; see feed() for the arguments."""
+
+    def _finish_unit(self, unit: list, seen_ids: Dict[str, int]) -> None:
+        """Finish a unit once the stream has ended; see finish()."""
+
+
+class _RequiredSegmentStream(_CategoryStream):
+    """Counts each required segment rule's matches as windows pass."""
+
+    name = "Required Segments"
+
+    def __init__(self, rules: List[Dict], collect_info: bool):
+        super().__init__(collect_info)
+        for rule in rules:
+            # Matches so far, line of the first match past max_occurrences
+            self._add_unit(RequiredSegmentValidator, rule, 0, None)
+
+    def _feed_unit(self, unit: list, window_index: SegmentIndex,
+                   context: List[Dict], seen_ids: Dict[str, int]) -> None:
+        validator, rule, before, _ = unit
+        segment_id = rule.get("segment_id")
+        if segment_id not in window_index:
+            return
+
+        matching = validator._find_matching_segments(
+            window_index, segment_id, rule.get("element_filters", {})
+        )
+        unit[2] = before + len(matching)
+
+        # Line of the first excess segment, if it falls in this window
+        max_occurrences = rule.get("max_occurrences")
+        if max_occurrences is not None and before <= max_occurrences < unit[2]:
+            unit[3] = matching[max_occurrences - before]["line"]
+
+    def _finish_unit(self, unit: list, seen_ids: Dict[str, int]) -> None:
+        validator, rule, count, excess_line = unit
+        validator._check_occurrences(rule, count, excess_line)
+
+
+class _ElementRuleStream(_CategoryStream):
+    """Runs the element validator over each window, rule by rule."""
+
+    name = "Element Rules"
+
+    def __init__(self, rules: List[Dict], collect_info: bool):
+        super().__init__(collect_info)
+        for rule in rules:
+            self._add_unit(ElementValidator, (rule,))
+
+    def _feed_unit(self, unit: list, window_index: SegmentIndex,
+                   context: List[Dict], seen_ids: Dict[str, int]) -> None:
+        validator, rules = unit
+        validator.validate(None, rules, window_index)
+
+
+class _ConditionalRuleStream(_CategoryStream):
+    """
+    Checks conditional triggers as windows pass.
+
+    within_loop rules are decided on the spot from the window's lookahead.
+    Rules requiring segments anywhere in the document keep a trigger only
+    until every required segment ID has been seen; triggers still waiting
+    at the end are the ones that report missing segments.
+    """
+
+    name = "Conditional Rules"
+
+    def __init__(self, rules: List[Dict], collect_info: bool):
+        super().__init__(collect_info)
+        for rule in rules:
+            # Compiled condition, then clause and waiting triggers, set on
+            # the first window holding the trigger segment: validate() only
+            # compiles rules whose trigger occurs
+            self._add_unit(ConditionalRuleValidator, rule, None, None, None)
+        self._lines: Optional[List[int]] = None
+
+    def feed(self, window_index: SegmentIndex, context: List[Dict],
+             seen_ids: Dict[str, int]) -> None:
+        # Line numbers for within_loop scans, taken once per window if needed
+        self._lines = None
+        super().feed(window_index, context, seen_ids)
+
+    def _feed_unit(self, unit: list, window_index: SegmentIndex,
+                   context: List[Dict], seen_ids: Dict[str, int]) -> None:
+        validator, rule, condition_met, then_clause, pending = unit
+        if_segment_id = rule.get("condition", {}).get("if_segment")
+        if if_segment_id not in window_index:
+            return
+
+        if condition_met is None:
+            condition_met = unit[2] = compile_condition(rule.get("condition", {}))
+            then_clause = unit[3] = _ThenClause(rule.get("then", {}), if_segment_id)
+            if then_clause.required_segments and not then_clause.within_loop:
+                pending = unit[4] = []
+
+        for trigger in window_index[if_segment_id]:
+            if not condition_met(trigger["elements"]):
+                continue
+
+            if pending is None:
+                if then_clause.within_loop and self._lines is None:
+                    self._lines = [seg["line"] for seg in context]
+                validator._check_then_clause(
+                    rule, trigger, context, then_clause, seen_ids, self._lines
+                )
+                continue
+
+            pending.append(trigger)
+            # Once every required segment has been seen, no waiting
+            # trigger can report a missing one
+            if all(seg_id in seen_ids for seg_id in then_clause.required_segments):
+                self._flush(unit, seen_ids)
+
+    def _finish_unit(self, unit: list, seen_ids: Dict[str, int]) -> None:
+        if unit[4]:
+            self._flush(unit, seen_ids)
+
+    @staticmethod
+    def _flush(unit: list, seen_ids: Dict[str, int]) -> None:
+        """
+        Check a rule's waiting triggers against the segment IDs seen so far.
+
+        Args:
+            unit: The rule's unit
+            seen_ids: Segment counts for everything read so far
+        """
+        validator, rule, _, then_clause, pending = unit
+        for trigger in pending:
+            validator._check_then_clause(rule, trigger, [], then_clause, seen_ids)
+        pending.clear()
+
+
+class _CrossSegmentStream(_CategoryStream):
+    """
+    Accumulates what each cross-segment rule needs from the document.
+
+    count_match keeps its target segments (e.g. CTT) and reads the source
+    count at the end; element_match pairs the n-th segment_1 with the n-th
+    segment_2 as soon as both have been seen; element_value_exists stops
+    looking once the value is found.
+    """
+
+    name = "Cross-Segment Rules"
+
+    def __init__(self, rules: List[Dict], collect_info: bool):
+        super().__init__(collect_info)
+        for rule in rules:
+            logic = rule.get("validation_logic", {})
+            validation_type = logic.get("type")
+
+            if validation_type == "count_match":
+                # Target segments seen so far
+                self._add_unit(CrossSegmentValidator, validation_type, rule, logic, [])
+            elif validation_type == "element_match":
+                # One unit per pair, so issues come out pair by pair; each
+                # keeps the segments still waiting for a partner
+                for pair in logic.get("match_pairs", []):
+                    self._add_unit(
+                        CrossSegmentValidator, validation_type, rule, pair, (deque(), deque())
+                    )
+            elif validation_type == "element_value_exists":
+                # Whether the value has been found
+                self._add_unit(CrossSegmentValidator, validation_type, rule, logic, False)
+
+    def _feed_unit(self, unit: list, window_index: SegmentIndex,
+                   context: List[Dict], seen_ids: Dict[str, int]) -> None:
+        validator, validation_type, rule, logic, state = unit
+
+        if validation_type == "count_match":
+            state.extend(window_index.get(logic.get("target_segment"), ()))
+        elif validation_type == "element_match":
+            firsts, seconds = state
+            firsts.extend(window_index.get(logic.get("segment_1"), ()))
+            seconds.extend(window_index.get(logic.get("segment_2"), ()))
+            while firsts and seconds:
+                validator._check_element_pair(rule, logic, firsts.popleft(), seconds.popleft())
+        elif not state:
+            segments = window_index.get(logic.get("segment_id"), ())
+            unit[4] = validator._has_element_value(logic, segments)
+
+    def _finish_unit(self, unit: list, seen_ids: Dict[str, int]) -> None:
+        validator, validation_type, rule, logic, state = unit
+
+        if validation_type == "count_match":
+            # Only declared counts are checked; no target segment, no check
+            if state:
+                source_count = seen_ids.get(logic.get("source_segment"), 0)
+                validator._check_declared_counts(rule, logic, state, source_count)
+        elif validation_type == "element_value_exists" and not state:
+            validator._report_missing_value(rule, logic)
+
+
+class StreamingValidator:
+    """
+    Validates a stream of parsed segments in bounded memory.
+
+    Reports the same issues, in the same order, as running the four
+    validators over the whole document.
+    """
+
+    def __init__(self, rules: Dict, collect_info: bool = True,
+                 window_size: int = WINDOW_SIZE):
+        """
+        Prepare per-rule state for a merged ruleset.
+
+        Args:
+            rules: Merged ruleset from RuleLoader
+            collect_info: Whether INFO-level issues are collected
+            window_size: Number of segments validated together
+        """
+        self.window_size = window_size
+        self.categories: List[_CategoryStream] = []
+
+        # Same categories, in the same order, as ValidationEngine.validate()
+        category_classes = (
+            (_RequiredSegmentStream, rules.get("required_segments", [])),
+            (_ElementRuleStream, rules.get("element_rules", [])),
+            (_ConditionalRuleStream, rules.get("conditional_rules", [])),
+            (_CrossSegmentStream, rules.get("cross_segment_rules", [])),
+        )
+        for category_class, category_rules in category_classes:
+            if category_rules:
+                self.categories.append(category_class(category_rules, collect_info))
+            else:
+                logger.debug(f"No rules for {category_class.name}, skipping")
+
+    def validate(self, segments: Iterable[Dict], error_collector: ErrorCollector) -> Dict[str, int]:
+        """
+        Validate segments as they arrive and report issues once all have passed.
+
+        Args:
+            segments: Parsed segment dictionaries, in document order
+            error_collector: Collector that receives the issues
+
+        Returns:
+            Number of segments seen per segment ID, in order of first appearance
+        """
+        window_size = self.window_size
+        # A window is only validated once the lookahead after it has arrived
+        batch_size = window_size + LOOP_SCAN_LIMIT
+        seen_ids: Dict[str, int] = {}
+        buffered: List[Dict] = []
+
+        for segment in segments:
+            segment_id = segment["segment_id"]
+            seen_ids[segment_id] = seen_ids.get(segment_id, 0) + 1
+            buffered.append(segment)
+
+            if len(buffered) >= batch_size:
+                self._feed(buffered[:window_size], buffered, seen_ids)
+                del buffered[:window_size]
+
+        if buffered:
+            self._feed(buffered, buffered, seen_ids)
+
+        for category in self.categories:
+            category.finish(seen_ids)
+            category.replay(error_collector)
+
+        return seen_ids
+
+    def _feed(self, window: List[Dict], context: List[Dict], seen_ids: Dict[str, int]) -> None:
+        """
+        Validate one window of segments.
+
+        Args:
+            window: Segments to validate
+            context: The window followed by its lookahead segments
+            seen_ids: Segment counts for everything read so far
+        """
+        window_index = index_segments(window)
+
+        for category in self.categories:
+            category.feed(window_index, context, seen_ids)
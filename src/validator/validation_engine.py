@@ -28,7 +28,7 @@ Usage:
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 from datetime import datetime
 
 from .error_collector import ErrorCollector
@@ -36,8 +36,11 @@ from .rule_evaluators import (
     RequiredSegmentValidator,
     ElementValidator,
     ConditionalRuleValidator,
-    CrossSegmentValidator
+    CrossSegmentValidator,
+    index_segments
 )
+from .stream_validator import StreamingValidator, WINDOW_SIZE
+from src.parser.segment_utils import has_complete_envelope
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -188,7 +191,8 @@ class ValidationEngine:
         self,
         parsed_edi: Dict,
         rules: Dict,
-        retailer: Optional[str] = None
+        retailer: Optional[str] = None,
+        collect_info: bool = True
     ) -> ValidationResult:
         """
         Validate a parsed EDI document against rules.
@@ -197,6 +201,7 @@ class ValidationEngine:
             parsed_edi: Parsed EDI document from EDIParser
             rules: Merged ruleset from RuleLoader
             retailer: Optional retailer name (for logging)
+            collect_info: Whether INFO-level issues are collected
 
         Returns:
             ValidationResult with all errors and statistics
@@ -210,7 +215,7 @@ class ValidationEngine:
         start_time = datetime.now()
 
         # Initialize error collector
-        self.error_collector = ErrorCollector()
+        self.error_collector = ErrorCollector(collect_info=collect_info)
 
         # Initialize validators
         required_seg_validator = RequiredSegmentValidator(self.error_collector)
@@ -223,33 +228,40 @@ class ValidationEngine:
         retailer_info = f" ({retailer})" if retailer else ""
         logger.info(f"Starting validation: {doc_type}{retailer_info}")
 
+        # Walk the document once; validators look up each rule's segments
+        segments_by_id = index_segments(parsed_edi.get("segments", []))
+
         # Run validators for each rule category
         self._validate_category(
             required_seg_validator,
             parsed_edi,
             rules.get("required_segments", []),
-            "Required Segments"
+            "Required Segments",
+            segments_by_id
         )
 
         self._validate_category(
             element_validator,
             parsed_edi,
             rules.get("element_rules", []),
-            "Element Rules"
+            "Element Rules",
+            segments_by_id
         )
 
         self._validate_category(
             conditional_validator,
             parsed_edi,
             rules.get("conditional_rules", []),
-            "Conditional Rules"
+            "Conditional Rules",
+            segments_by_id
         )
 
         self._validate_category(
             cross_segment_validator,
             parsed_edi,
             rules.get("cross_segment_rules", []),
-            "Cross-Segment Rules"
+            "Cross-Segment Rules",
+            segments_by_id
         )
 
         # Calculate validation time
@@ -272,8 +284,90 @@ class ValidationEngine:
             validation_time=validation_time
         )
 
+    def validate_stream(
+        self,
+        segments: Iterable[Dict],
+        rules: Dict,
+        retailer: Optional[str] = None,
+        collect_info: bool = True,
+        metadata: Optional[Dict] = None,
+        window_size: int = WINDOW_SIZE
+    ) -> ValidationResult:
+        """
+        Validate parsed segments as they arrive, without holding the document.
+
+        Reports the same issues as validate() on the whole document, while
+        only a window of segments (plus what document-wide rules still
+        need) is held at a time. The result's parsed_edi carries metadata
+        and statistics but no "segments" list.
+
+        Args:
+            segments: Parsed segments in document order, e.g. from
+                EDIParser.iter_parsed_segments()
+            rules: Merged ruleset from RuleLoader
+            retailer: Optional retailer name (for logging)
+            collect_info: Whether INFO-level issues are collected
+            metadata: Metadata dictionary the segment source fills in
+                (as iter_parsed_segments() does); read once the stream ends
+            window_size: Number of segments validated together
+
+        Returns:
+            ValidationResult with all errors and statistics
+
+        Example:
+            >>> with open("samples/edi_850_valid.txt", "rb") as f:
+            ...     metadata = {}
+            ...     segments = EDIParser().iter_parsed_segments(f, metadata=metadata)
+            ...     result = engine.validate_stream(segments, rules, metadata=metadata)
+        """
+        start_time = datetime.now()
+
+        # Initialize error collector
+        self.error_collector = ErrorCollector(collect_info=collect_info)
+
+        # Metadata is only complete once the envelope has streamed past
+        retailer_info = f" ({retailer})" if retailer else ""
+        logger.info(f"Starting streaming validation{retailer_info}")
+
+        streaming_validator = StreamingValidator(rules, collect_info, window_size)
+        seen_ids = streaming_validator.validate(segments, self.error_collector)
+
+        segment_counts = {seg_id: seen_ids[seg_id] for seg_id in sorted(seen_ids)}
+        parsed_edi = {
+            "metadata": metadata if metadata is not None else {},
+            "statistics": {
+                "total_segments": sum(segment_counts.values()),
+                "segment_counts": segment_counts,
+                "has_envelope": has_complete_envelope(segment_counts)
+            }
+        }
+
+        # Calculate validation time
+        end_time = datetime.now()
+        validation_time = (end_time - start_time).total_seconds()
+
+        # Log completion
+        stats = self.error_collector.get_statistics()
+        logger.info(
+            f"Validation complete: {stats['by_severity']['ERROR']} errors, "
+            f"{stats['by_severity']['WARNING']} warnings "
+            f"({validation_time:.3f}s)"
+        )
+
+        return ValidationResult(
+            error_collector=self.error_collector,
+            parsed_edi=parsed_edi,
+            rules=rules,
+            validation_time=validation_time
+        )
+
     def _validate_category(
-        self, validator, parsed_edi: Dict, rules: list, category_name: str
+        self,
+        validator,
+        parsed_edi: Dict,
+        rules: list,
+        category_name: str,
+        segments_by_id: Optional[Dict] = None
     ) -> None:
         """
         Run a specific validator category.
@@ -283,6 +377,7 @@ class ValidationEngine:
             parsed_edi: Parsed EDI document
             rules: Rules for this category
             category_name: Name of category (for logging)
+            segments_by_id: Shared segment index, for validators that accept one
         """
         if not rules:
             logger.debug(f"No rules for {category_name}, skipping")
@@ -291,7 +386,10 @@ class ValidationEngine:
         logger.debug(f"Validating {len(rules)} {category_name} rules")
 
         try:
-            validator.validate(parsed_edi, rules)
+            if segments_by_id is None:
+                validator.validate(parsed_edi, rules)
+            else:
+                validator.validate(parsed_edi, rules, segments_by_id)
         except Exception as e:
             logger.error(f"Error during {category_name} validation: {e}")
             # Add a system error
@@ -9,7 +9,9 @@ Tests cover:
 - JSON output
 """
 
+import json
 import sys
+from io import BytesIO
 from pathlib import Path
 
 # Add src to path for imports
@@ -17,6 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.parser.edi_parser import EDIParser
 from src.parser.segment_utils import (
+    iter_segments,
     split_segments,
     split_elements,
     get_segment_id,
@@ -34,6 +37,14 @@ def test_normalize_edi_text():
     print("✓ test_normalize_edi_text passed")
 
 
+def test_normalize_mixed_line_endings():
+    """Test normalization of CR/CRLF endings and whitespace-only lines."""
+    raw = "ISA*00*~  \r\n \t \r\n\rGS*PO*~\r  ST*850*0001~\n"
+    assert normalize_edi_text(raw) == "ISA*00*~\nGS*PO*~\nST*850*0001~"
+    assert normalize_edi_text(" \tISA*00*~GS*PO*~ ") == "ISA*00*~GS*PO*~"
+    print("✓ test_normalize_mixed_line_endings passed")
+
+
 def test_split_segments():
     """Test segment splitting."""
     edi_text = "ISA*00*TEST~GS*PO*SENDER~ST*850*0001~"
@@ -45,6 +56,16 @@ def test_split_segments():
     print("✓ test_split_segments passed")
 
 
+def test_iter_segments_across_windows():
+    """Test segment scanning on text spanning many scan windows."""
+    long_segment = "N1*ST*" + "X" * 70000
+    edi_text = "ISA*00*TEST~ " * 20000 + long_segment + "~GS*PO*SENDER~~"
+    segments = list(iter_segments(edi_text))
+    assert segments == [seg for seg in map(str.strip, edi_text.split("~")) if seg]
+    assert segments[20000] == long_segment
+    print("✓ test_iter_segments_across_windows passed")
+
+
 def test_split_elements():
     """Test element splitting."""
     segment = "BEG*00*NE*PO123456**20231215"
@@ -99,6 +120,11 @@ def test_parse_850_valid():
     assert result['statistics']['total_segments'] > 0
     assert result['statistics']['has_envelope'] == True
 
+    # Segment counts are keyed in sorted segment-ID order
+    segment_counts = result['statistics']['segment_counts']
+    assert list(segment_counts) == sorted(segment_counts)
+    assert segment_counts['PO1'] == 2
+
     print("✓ test_parse_850_valid passed")
     print(f"  - Parsed {result['statistics']['total_segments']} segments")
     print(f"  - Document type: {result['metadata']['doc_type']}")
@@ -120,6 +146,34 @@ def test_get_segments_by_id():
     print("✓ test_get_segments_by_id passed")
 
 
+def test_segment_index_rebuilt_on_reparse():
+    """Test that segment lookups reflect the most recently parsed document."""
+    parser = EDIParser()
+    parser.parse_file("samples/edi_850_valid.txt")
+    assert len(parser.get_segments_by_id("PO1")) == 2
+
+    result = parser.parse_file("samples/edi_856_valid.txt")
+    assert parser.get_segments_by_id("PO1") == []
+    assert parser.get_segments_by_id("BSN")[0] is next(
+        seg for seg in result['segments'] if seg['segment_id'] == "BSN"
+    )
+    assert parser.get_segments_by_id("NOPE") == []
+
+    print("✓ test_segment_index_rebuilt_on_reparse passed")
+
+
+def test_short_codes_interned():
+    """Test that repeated short codes share a single string object."""
+    parser = EDIParser()
+    result = parser.parse_file("samples/edi_850_valid.txt")
+
+    po1_segments = [seg for seg in result['segments'] if seg['segment_id'] == "PO1"]
+    assert po1_segments[0]['elements'][0] is po1_segments[1]['elements'][0]
+    assert po1_segments[0]['elements'][3] is po1_segments[1]['elements'][3]  # "EA"
+
+    print("✓ test_short_codes_interned passed")
+
+
 def test_get_element_value_method():
     """Test getting element values from parsed document."""
     parser = EDIParser()
@@ -136,6 +190,61 @@ def test_get_element_value_method():
     print("✓ test_get_element_value_method passed")
 
 
+def test_parse_without_raw():
+    """Test that include_raw=False drops only the 'raw' segment field."""
+    expected = EDIParser().parse_file("samples/edi_850_valid.txt")
+    result = EDIParser(include_raw=False).parse_file("samples/edi_850_valid.txt")
+
+    assert all('raw' not in seg for seg in result['segments'])
+    for seg in expected['segments']:
+        del seg['raw']
+    assert result == expected
+
+    print("✓ test_parse_without_raw passed")
+
+
+def test_parse_file_streaming():
+    """Test that chunked parsing matches whole-file parsing."""
+    for sample in ("samples/edi_850_valid.txt", "samples/edi_810_valid.txt"):
+        expected = EDIParser().parse_file(sample)
+
+        # Tiny chunks force segments to straddle chunk boundaries
+        parser = EDIParser()
+        result = parser.parse_file_streaming(sample, chunk_size=7)
+        assert result == expected
+        assert parser.get_segments_by_id("ST")[0]['line'] == 3
+
+        # In-memory uploads go through the same chunked path
+        stream = BytesIO(Path(sample).read_bytes())
+        assert EDIParser().parse_stream(stream, chunk_size=7) == expected
+
+        # Bytes already in memory are parsed without a stream
+        assert EDIParser().parse_bytes(Path(sample).read_bytes()) == expected
+
+    print("✓ test_parse_file_streaming passed")
+
+
+def test_iter_parsed_segments():
+    """Test that segment-at-a-time parsing matches whole-file parsing."""
+    for sample in ("samples/edi_850_valid.txt", "samples/edi_810_valid.txt"):
+        expected = EDIParser().parse_file(sample)
+
+        metadata = {}
+        stream = BytesIO(Path(sample).read_bytes())
+        segments = EDIParser().iter_parsed_segments(stream, chunk_size=7, metadata=metadata)
+        assert list(segments) == expected['segments']
+        assert metadata == expected['metadata']
+
+    # Like parse_stream(), a stream without segments is rejected
+    try:
+        list(EDIParser().iter_parsed_segments(BytesIO(b"\n\n")))
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+    print("✓ test_iter_parsed_segments passed")
+
+
 def test_parse_invalid_850():
     """Test parsing invalid 850 document."""
     parser = EDIParser()
@@ -157,6 +266,10 @@ def test_to_json():
     assert '"doc_type": "850"' in json_str
     assert '"segments"' in json_str
 
+    # Bytes export decodes to the same document as the string export
+    assert json.loads(parser.to_json_bytes()) == json.loads(json_str)
+    assert json.loads(parser.to_json_bytes(indent=None)) == parser.to_dict()
+
     print("✓ test_to_json passed")
 
 
@@ -169,7 +282,9 @@ def run_all_tests():
     try:
         # Unit tests
         test_normalize_edi_text()
+        test_normalize_mixed_line_endings()
         test_split_segments()
+        test_iter_segments_across_windows()
         test_split_elements()
         test_get_segment_id()
         test_get_element_value()
@@ -177,7 +292,12 @@ def run_all_tests():
         # Integration tests
         test_parse_850_valid()
         test_get_segments_by_id()
+        test_segment_index_rebuilt_on_reparse()
+        test_short_codes_interned()
         test_get_element_value_method()
+        test_parse_without_raw()
+        test_parse_file_streaming()
+        test_iter_parsed_segments()
         test_parse_invalid_850()
         test_to_json()
 
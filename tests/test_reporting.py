@@ -0,0 +1,137 @@
+"""
+Unit tests for Report Generator module.
+
+Tests cover:
+- Report caching
+- Cache invalidation
+- Saving reports to disk
+- Streaming JSON and CSV reports
+"""
+
+import json
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.validator.validation_engine import ValidationEngine
+from src.reporting.report_generator import ReportGenerator
+from src.reporting.formatters import JSONFormatter
+
+
+def _invalid_850_result():
+    """Validate the invalid 850 sample, which produces errors and warnings."""
+    engine = ValidationEngine()
+    return engine.validate_file("samples/edi_850_invalid.txt", "850")
+
+
+def test_reports_cached():
+    """Test that each report format is rendered once per generator."""
+    generator = ReportGenerator(_invalid_850_result())
+
+    assert generator.generate_text_report() is generator.generate_text_report()
+    assert generator.generate_csv_report() is generator.generate_csv_report()
+    assert generator.generate_dashboard() is generator.generate_dashboard()
+
+    # JSON is cached per indent
+    assert generator.generate_json_report() is generator.generate_json_report(indent=2)
+    assert generator.generate_json_report(indent=None) != generator.generate_json_report()
+
+    print("✓ test_reports_cached passed")
+
+
+def test_invalidate_cache():
+    """Test that invalidate_cache forces reports to be re-rendered."""
+    generator = ReportGenerator(_invalid_850_result())
+
+    text_report = generator.generate_text_report()
+    generator.invalidate_cache()
+    rerendered = generator.generate_text_report()
+
+    assert rerendered is not text_report
+    assert rerendered == text_report
+
+    print("✓ test_invalidate_cache passed")
+
+
+def test_save_all_formats():
+    """Test saving every format, with and without reported sizes."""
+    generator = ReportGenerator(_invalid_850_result())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files = generator.save_all_formats(tmp_dir, "report")
+        assert set(files) == {'text', 'json', 'csv', 'dashboard'}
+
+        # CSV is streamed to disk on first save; it must match the string API
+        csv_bytes = Path(files['csv']).read_bytes()
+        assert csv_bytes == generator.generate_csv_report().encode('utf-8')
+
+        sized = generator.save_all_formats(tmp_dir, "sized", include_sizes=True)
+        for file_path, size in sized.values():
+            assert Path(file_path).stat().st_size == size
+
+    print("✓ test_save_all_formats passed")
+
+
+def test_save_json_streamed():
+    """Test that JSON streamed to disk matches the string API."""
+    generator = ReportGenerator(_invalid_850_result())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for indent in (2, 4):
+            json_path = Path(tmp_dir) / f"report_{indent}.json"
+            size = generator.save_report(str(json_path), format="json", indent=indent)
+            assert json_path.stat().st_size == size
+
+            saved = json.loads(json_path.read_text(encoding='utf-8'))
+            expected = json.loads(generator.generate_json_report(indent=indent))
+            saved.pop('generated_at')
+            expected.pop('generated_at')
+            assert saved == expected
+
+    # Text streams without a binary buffer get the same document
+    stream = StringIO()
+    JSONFormatter.write_report(generator.validation_result, stream)
+    streamed = json.loads(stream.getvalue())
+    streamed.pop('generated_at')
+    assert streamed == expected
+
+    print("✓ test_save_json_streamed passed")
+
+
+def run_all_tests():
+    """Run all reporting tests."""
+    print("\n" + "=" * 50)
+    print("Running Report Generator Tests")
+    print("=" * 50 + "\n")
+
+    try:
+        test_reports_cached()
+        test_invalidate_cache()
+        test_save_all_formats()
+        test_save_json_streamed()
+
+        print("\n" + "=" * 50)
+        print("✓ All tests passed!")
+        print("=" * 50 + "\n")
+
+        return True
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    except Exception as e:
+        print(f"\n✗ Error during testing: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
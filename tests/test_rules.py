@@ -10,7 +10,12 @@ Tests cover:
 - Rule querying
 """
 
+import json
+import os
+import pickle
 import sys
+import tempfile
+import threading
 from pathlib import Path
 
 # Add src to path for imports
@@ -205,6 +210,61 @@ def test_get_rules_by_segment():
     print("✓ test_get_rules_by_segment passed")
 
 
+def test_rule_indexes_match_scan():
+    """Test that indexed lookups agree with a scan of the merged ruleset."""
+    loader = RuleLoader()
+    merged = loader.load_rules("850", "target")
+
+    for rule_id in ("CORE_REQ_ISA", "850_COND_N1_ST_ADDRESS", "NOT_A_RULE"):
+        expected = next(
+            (r for rules in merged.values() if isinstance(rules, list)
+             for r in rules if r.get("rule_id") == rule_id),
+            None
+        )
+        assert loader.get_rule_by_id(rule_id) is expected
+
+    for segment_id in ("ISA", "BEG", "N1", "PO1", "ZZZ"):
+        expected = [
+            r for r in merged["required_segments"] + merged["element_rules"]
+            if r.get("segment_id") == segment_id
+        ] + [
+            r for r in merged["conditional_rules"]
+            if r.get("condition", {}).get("if_segment") == segment_id
+        ]
+        assert list(loader.get_rules_by_segment(segment_id)) == expected
+
+    # Indexed rules are read-only, including nested fields
+    try:
+        loader.get_rule_by_id("CORE_REQ_ISA")["severity"] = "INFO"
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+
+    element_rule = loader.get_rule_by_id("850_N103_ID_CODE_QUAL")
+    try:
+        element_rule["validations"]["allowed_values"].append("NOT_A_CODE")
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    try:
+        element_rule["validations"]["min_length"] = 0
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    assert "NOT_A_CODE" not in next(
+        r for r in merged["element_rules"] if r["rule_id"] == "850_N103_ID_CODE_QUAL"
+    )["validations"]["allowed_values"]
+
+    conditional = loader.get_rule_by_id("850_COND_N1_ST_ADDRESS")
+    try:
+        conditional["then"]["required_segments"].append("ZZZ")
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+
+    print("✓ test_rule_indexes_match_scan passed")
+
+
 def test_get_statistics():
     """Test getting rule statistics."""
     loader = RuleLoader()
@@ -223,6 +283,10 @@ def test_get_statistics():
     # Should have ERROR severity rules
     assert stats["by_severity"]["ERROR"] > 0
 
+    # Statistics are cached, but callers get their own copy
+    stats["by_severity"]["ERROR"] = -1
+    assert loader.get_statistics()["by_severity"]["ERROR"] > 0
+
     print("✓ test_get_statistics passed")
     print(f"  Total rules loaded: {stats['total_rules']}")
     print(f"  ERROR rules: {stats['by_severity']['ERROR']}")
@@ -240,6 +304,9 @@ def test_to_json():
     assert '"doc_type": "850"' in json_str
     assert '"required_segments"' in json_str
 
+    # The orjson fast path and the stdlib encoder must agree
+    assert json.loads(json_str) == json.loads(loader.to_json(indent=4))
+
     print("✓ test_to_json passed")
 
 
@@ -287,6 +354,146 @@ def test_retailer_overrides_applied():
     print("✓ test_retailer_overrides_applied passed")
 
 
+def test_overrides_do_not_mutate_sources():
+    """Test that overrides copy rules instead of mutating loaded rulesets."""
+    loader = RuleLoader()
+    merged = loader.load_rules("850", "amazon")
+
+    overridden = loader.get_rule_by_id("850_N103_ID_CODE_QUAL")
+    assert "A2" in overridden["validations"]["allowed_values"]
+
+    source = next(
+        r for r in loader.document_rules["element_rules"]
+        if r["rule_id"] == "850_N103_ID_CODE_QUAL"
+    )
+    assert "A2" not in source["validations"]["allowed_values"]
+
+    # Rules without overrides are shared with the source ruleset
+    beg_rule = next(r for r in merged["required_segments"] if r["rule_id"] == "850_REQ_BEG")
+    assert any(r is beg_rule for r in loader.document_rules["required_segments"])
+    assert merged["ruleset_info"]["retailer"] == "amazon"
+
+    print("✓ test_overrides_do_not_mutate_sources passed")
+
+
+def test_overrides_apply_to_every_copy():
+    """Test that an override reaches a rule_id present in two categories."""
+    rule = {"rule_id": "DUP", "segment_id": "BEG", "severity": "WARNING"}
+    core = {
+        "required_segments": [dict(rule)],
+        "conditional_rules": [dict(rule)]
+    }
+    ret = {
+        "overrides": [{
+            "rule_id": "DUP",
+            "override_type": "severity_escalation",
+            "new_severity": "ERROR"
+        }]
+    }
+
+    merged = RuleLoader()._merge_rulesets(core, {}, ret, "850", "test")
+
+    assert merged["required_segments"][0]["severity"] == "ERROR"
+    assert merged["conditional_rules"][0]["severity"] == "ERROR"
+
+    # Sources are left untouched
+    assert core["required_segments"][0]["severity"] == "WARNING"
+    assert core["conditional_rules"][0]["severity"] == "WARNING"
+
+    print("✓ test_overrides_apply_to_every_copy passed")
+
+
+def test_loaded_rules_read_only():
+    """Test that one loader's rules cannot be changed through another's."""
+    rules = RuleLoader().load_rules("850", "walmart")
+    rule = rules["element_rules"][0]
+    rule_id = rule["rule_id"]
+    severity = rule["severity"]
+
+    for mutate in (
+        lambda: rule.__setitem__("severity", "INFO"),
+        lambda: rule["validations"].update(required=False),
+        lambda: rules["element_rules"].append({"rule_id": "EXTRA"}),
+        lambda: rules.pop("conditional_rules"),
+        lambda: rules["ruleset_info"]["rulesets_applied"].clear(),
+    ):
+        try:
+            mutate()
+            assert False, "Should have raised TypeError"
+        except TypeError:
+            pass
+
+    for retailer in (None, "walmart", "amazon"):
+        other = RuleLoader()
+        other.load_rules("850", retailer)
+        assert other.get_rule_by_id(rule_id)["severity"] == severity
+
+    # Read-only rules still pickle and serialize like plain ones
+    assert pickle.loads(pickle.dumps(rules)) == rules
+    assert json.loads(json.dumps(rules)) == rules
+
+    print("✓ test_loaded_rules_read_only passed")
+
+
+def test_rule_files_cached():
+    """Test that rule files are parsed once and reloaded when modified."""
+    assert RuleLoader().load_core_rules() is RuleLoader().load_core_rules()
+
+    loader = RuleLoader()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        rule_file = Path(tmp_dir) / "rules.json"
+        rule_file.write_text('{"version": 1}', encoding='utf-8')
+        assert loader._load_json_file(rule_file) == {"version": 1}
+
+        # A newer mtime invalidates the cached parse
+        rule_file.write_text('{"version": 2}', encoding='utf-8')
+        mtime = rule_file.stat().st_mtime + 10
+        os.utime(rule_file, (mtime, mtime))
+        assert loader._load_json_file(rule_file) == {"version": 2}
+
+    print("✓ test_rule_files_cached passed")
+
+
+def test_merged_rules_cached():
+    """Test that repeated load_rules calls reuse the merged ruleset."""
+    for retailer in (None, "walmart"):
+        first = RuleLoader().load_rules("850", retailer)
+        loader = RuleLoader()
+        assert loader.load_rules("850", retailer) is first
+
+        # Indexes are restored along with the cached ruleset
+        assert loader.get_rule_by_id("850_REQ_BEG") is not None
+        assert loader.get_rules_by_segment("BEG")
+
+    assert RuleLoader().load_rules("850", "amazon") is not first
+
+    # Concurrent misses that evict entries must not raise
+    errors = []
+
+    def load_all():
+        try:
+            for doc_type in ("850", "856", "810"):
+                for retailer in (None, "walmart", "amazon", "target"):
+                    RuleLoader().load_rules(doc_type, retailer)
+        except Exception as e:
+            errors.append(e)
+
+    saved_size = RuleLoader._MERGED_CACHE_SIZE
+    RuleLoader._MERGED_CACHE_SIZE = 2
+    try:
+        threads = [threading.Thread(target=load_all) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        RuleLoader._MERGED_CACHE_SIZE = saved_size
+
+    assert not errors, errors
+
+    print("✓ test_merged_rules_cached passed")
+
+
 def run_all_tests():
     """Run all rule loading tests."""
     print("\n" + "=" * 50)
@@ -315,6 +522,7 @@ def run_all_tests():
         # Query tests
         test_get_rule_by_id()
         test_get_rules_by_segment()
+        test_rule_indexes_match_scan()
         test_get_statistics()
         test_to_json()
 
@@ -322,6 +530,11 @@ def run_all_tests():
         test_invalid_doc_type()
         test_invalid_retailer()
         test_retailer_overrides_applied()
+        test_overrides_do_not_mutate_sources()
+        test_overrides_apply_to_every_copy()
+        test_loaded_rules_read_only()
+        test_rule_files_cached()
+        test_merged_rules_cached()
 
         print("\n" + "=" * 50)
         print("✓ All tests passed!")
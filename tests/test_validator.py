@@ -11,6 +11,7 @@ Tests cover:
 """
 
 import sys
+from io import BytesIO
 from pathlib import Path
 
 # Add src to path for imports
@@ -20,6 +21,14 @@ from src.parser.edi_parser import EDIParser
 from src.rules.rule_loader import RuleLoader
 from src.validator.validation_engine import ValidationEngine
 from src.validator.error_collector import ErrorCollector, ValidationError
+from src.validator.rule_evaluators import (
+    ConditionalRuleValidator,
+    CrossSegmentValidator,
+    ElementValidator,
+    compile_condition,
+    compile_element_conditional,
+    index_segments
+)
 
 
 def test_error_collector():
@@ -68,6 +77,13 @@ def test_error_collector():
     assert stats['by_severity']['WARNING'] == 1
     assert stats['is_compliant'] == False
 
+    # Repeated identifiers share one interned string
+    first = ValidationError("".join(["TEST", "_001"]), "error", "a", "".join(["B", "EG"]))
+    second = ValidationError("".join(["TEST", "_001"]), "error", "b", "".join(["B", "EG"]))
+    assert first.rule_id is second.rule_id
+    assert first.severity is second.severity
+    assert first.segment_id is second.segment_id
+
     print("✓ test_error_collector passed")
 
 
@@ -217,6 +233,14 @@ def test_error_by_segment():
     po1_errors = collector.get_errors_by_segment("PO1")
     assert len(po1_errors) == 1
 
+    # Lookups keep severity order, as when filtering get_all_errors()
+    collector.add_error("R4", "WARNING", "BEG warning", segment_id="BEG", line_number=5)
+    collector.add_error("R5", "ERROR", "Late BEG error", segment_id="BEG", line_number=7)
+    expected = [e for e in collector.get_all_errors() if e.segment_id == "BEG"]
+    assert collector.get_errors_by_segment("BEG") == expected
+    assert [e.rule_id for e in collector.get_errors_by_line(5)] == ["R1", "R4"]
+    assert collector.get_errors_by_segment("N1") == []
+
     print("✓ test_error_by_segment passed")
 
 
@@ -239,6 +263,248 @@ def test_error_by_line():
     print("✓ test_error_by_line passed")
 
 
+def test_error_statistics_order():
+    """Test that statistics count in ERROR, WARNING, INFO order."""
+    collector = ErrorCollector()
+
+    collector.add_error("R1", "INFO", "Info on N1", segment_id="N1")
+    collector.add_error("R2", "warning", "Warning on PO1", segment_id="PO1")
+    collector.add_error("R3", "ERROR", "Error on BEG", segment_id="BEG")
+    collector.add_error("R2", "WARNING", "Warning without segment")
+    collector.add_error("R1", "ERROR", "Error on N1", segment_id="N1")
+
+    stats = collector.get_statistics()
+    assert list(stats['by_segment'].items()) == [("BEG", 1), ("N1", 2), ("PO1", 1)]
+    assert list(stats['by_rule'].items()) == [("R3", 1), ("R1", 2), ("R2", 2)]
+
+    # Statistics are cached until the collector changes, but every caller
+    # gets its own copy
+    cached = collector._stats_cache
+    assert collector.get_statistics() == stats
+    assert collector._stats_cache is cached
+
+    stats['by_severity']['ERROR'] = 99
+    stats['by_segment']['N1'] = 99
+    stats['by_rule'].clear()
+    stats['total_errors'] = 0
+    fresh = collector.get_statistics()
+    assert fresh['by_severity']['ERROR'] == 2
+    assert fresh['by_segment']['N1'] == 2
+    assert fresh['by_rule']['R1'] == 2
+    assert fresh['total_errors'] == 5
+
+    collector.add_error("R4", "INFO", "Info on PID", segment_id="PID")
+    assert collector.get_statistics()['by_rule']['R4'] == 1
+
+    collector.clear()
+    assert collector.get_statistics()['by_rule'] == {}
+
+    print("✓ test_error_statistics_order passed")
+
+
+def test_collect_info():
+    """Test that INFO-level issues can be skipped at collection time."""
+    collector = ErrorCollector(collect_info=False)
+    collector.add_error(rule_id="R1", severity="info", message="note")
+    collector.add_error(rule_id="R2", severity="WARNING", message="warn")
+    assert collector.info == []
+    assert len(collector) == 1
+
+    collector.set_collect_info(True)
+    collector.add_error(rule_id="R1", severity="INFO", message="note")
+    assert len(collector.info) == 1
+
+    # The engine collects INFO by default and can skip it per run
+    parsed = EDIParser().parse_file("samples/edi_850_valid.txt")
+    rules = {"element_rules": [{
+        "rule_id": "TEST_INFO",
+        "severity": "INFO",
+        "segment_id": "BEG",
+        "element_position": "1",
+        "validations": {"allowed_values": ["XX"]}
+    }]}
+    engine = ValidationEngine()
+    assert engine.validate(parsed, rules).total_issues() == 1
+    assert engine.validate(parsed, rules, collect_info=False).total_issues() == 0
+
+    print("✓ test_collect_info passed")
+
+
+def test_compiled_conditions():
+    """Test that compiled rule conditions match the rule semantics."""
+    elements = ["N1", "ST ", "Store", "92", ""]
+
+    conditional = compile_element_conditional({"if_element": "1", "equals": "ST"})
+    assert conditional(elements)
+    assert not conditional(["N1"])
+    assert not compile_element_conditional({"equals": "ST"})(elements)
+
+    # if_value alone must match exactly
+    assert compile_condition({"if_element": "3", "if_value": "92"})(elements)
+    assert not compile_condition({"if_element": "3", "if_value": "91"})(elements)
+
+    # if_value_exists accepts any non-empty value, even alongside if_value
+    assert compile_condition({"if_element": "3", "if_value_exists": True})(elements)
+    assert compile_condition({"if_element": "3", "if_value": "91", "if_value_exists": True})(elements)
+    assert not compile_condition({"if_element": "4", "if_value_exists": True})(elements)
+    assert not compile_condition({"if_element": "9", "if_value_exists": True})(elements)
+    assert not compile_condition({"if_element": "3"})(elements)
+
+    print("✓ test_compiled_conditions passed")
+
+
+def test_segment_index():
+    """Test the shared segment index and that validators agree with or without it."""
+    parser = EDIParser()
+    parsed = parser.parse_file("samples/edi_850_invalid.txt")
+    segments = parsed["segments"]
+
+    by_id = index_segments(segments)
+    assert sum(len(group) for group in by_id.values()) == len(segments)
+    assert by_id["PO1"] == [s for s in segments if s["segment_id"] == "PO1"]
+
+    rules = RuleLoader().load_rules("850")["element_rules"]
+    with_index = ErrorCollector()
+    ElementValidator(with_index).validate(parsed, rules, by_id)
+    without_index = ErrorCollector()
+    ElementValidator(without_index).validate(parsed, rules)
+
+    assert [e.to_dict() for e in with_index.get_all_errors()] == \
+        [e.to_dict() for e in without_index.get_all_errors()]
+
+    # Validators subscript these fields, so every parse path must set them
+    with open("samples/edi_856_valid.txt", "rb") as f:
+        streamed = EDIParser(include_raw=False).parse_stream(f, chunk_size=7)
+    for document in (parsed, streamed):
+        for segment in document["segments"]:
+            assert {"line", "segment_id", "elements"} <= segment.keys()
+
+    print("✓ test_segment_index passed")
+
+
+def test_count_match():
+    """Test that CTT01 is checked against the number of PO1 line items."""
+    parser = EDIParser()
+    content = Path("samples/edi_850_valid.txt").read_text()
+    rules = [
+        rule for rule in RuleLoader().load_rules("850")["cross_segment_rules"]
+        if rule["rule_id"] == "850_CROSS_CTT_PO1_COUNT"
+    ]
+
+    collector = ErrorCollector()
+    CrossSegmentValidator(collector).validate(parser.parse_text(content), rules)
+    assert len(collector) == 0
+
+    collector = ErrorCollector()
+    CrossSegmentValidator(collector).validate(
+        parser.parse_text(content.replace("CTT*2~", "CTT*5~")), rules
+    )
+    issues = collector.get_all_errors()
+    assert len(issues) == 1
+    assert issues[0].expected_value == "2"
+    assert issues[0].actual_value == "5"
+
+    print("✓ test_count_match passed")
+
+
+def test_within_loop():
+    """Test that within_loop checks only look inside the trigger's loop."""
+    parser = EDIParser()
+    content = Path("samples/edi_850_valid.txt").read_text()
+    rules = [
+        rule for rule in RuleLoader().load_rules("850")["conditional_rules"]
+        if rule["rule_id"] == "850_COND_N1_ST_ADDRESS"
+    ]
+
+    collector = ErrorCollector()
+    ConditionalRuleValidator(collector).validate(parser.parse_text(content), rules)
+    assert len(collector) == 0
+
+    # N3 still appears later in the document, but not in the Ship-To loop
+    parsed = parser.parse_text(content.replace("N3*123 MAIN STREET~", "", 1))
+    collector = ErrorCollector()
+    ConditionalRuleValidator(collector).validate(parsed, rules)
+    issues = collector.get_all_errors()
+    assert [issue.context["expected_segment"] for issue in issues] == ["N3"]
+
+    # Segments out of line order take the linear scan and agree
+    parsed["segments"][0], parsed["segments"][1] = parsed["segments"][1], parsed["segments"][0]
+    collector = ErrorCollector()
+    ConditionalRuleValidator(collector).validate(parsed, rules)
+    assert [e.to_dict() for e in collector.get_all_errors()] == [e.to_dict() for e in issues]
+
+    print("✓ test_within_loop passed")
+
+
+def test_validate_stream():
+    """Test that streaming validation reports what whole-document validation does."""
+    content = Path("samples/edi_850_valid.txt").read_text()
+    documents = [
+        Path(sample).read_text()
+        for sample in sorted(Path("samples").glob("edi_*.txt"))
+    ] + [
+        # Excess, missing and late segments, miscounts and loop gaps
+        content.replace("PO1*", "PO1*~PO1*", 1),
+        content.replace("CTT*2~", "CTT*5~"),
+        content.replace("N3*123 MAIN STREET~", "", 1),
+        content.replace("BEG*", "REF*DP*~BEG*", 1),
+    ]
+
+    for text in documents:
+        parsed = EDIParser().parse_text(text)
+        for doc_type in ("850", "856", "810"):
+            for retailer in (None, "walmart", "amazon", "target"):
+                rules = RuleLoader().load_rules(doc_type, retailer)
+                expected = ValidationEngine().validate(parsed, rules, retailer)
+
+                # Small windows put triggers, pairs and loops across window edges
+                for window_size in (1, 3, 1024):
+                    metadata = {}
+                    segments = EDIParser().iter_parsed_segments(
+                        BytesIO(text.encode("utf-8")), metadata=metadata
+                    )
+                    result = ValidationEngine().validate_stream(
+                        segments, rules, retailer, metadata=metadata, window_size=window_size
+                    )
+
+                    assert [e.to_dict() for e in result.get_all_issues()] == \
+                        [e.to_dict() for e in expected.get_all_issues()]
+                    assert result.parsed_edi["metadata"] == parsed["metadata"]
+                    assert result.parsed_edi["statistics"] == parsed["statistics"]
+                    assert "segments" not in result.parsed_edi
+
+    # INFO issues are dropped the same way
+    rules = {"required_segments": [{
+        "rule_id": "TEST_INFO_PO1",
+        "segment_id": "PO1",
+        "description": "At most one PO1",
+        "max_occurrences": 1,
+        "severity": "INFO"
+    }]}
+    parsed = EDIParser().parse_text(content)
+    for collect_info in (True, False):
+        expected = ValidationEngine().validate(parsed, rules, collect_info=collect_info)
+        result = ValidationEngine().validate_stream(
+            iter(parsed["segments"]), rules, collect_info=collect_info
+        )
+        assert [e.to_dict() for e in result.get_all_issues()] == \
+            [e.to_dict() for e in expected.get_all_issues()]
+        assert result.total_issues() == (1 if collect_info else 0)
+
+    # A failing rule stops its category at the same place in both paths
+    element_rules = RuleLoader().load_rules("850")["element_rules"]
+    broken = {"rule_id": "TEST_BROKEN", "severity": "ERROR", "segment_id": "PO1", "element_position": "x"}
+    rules = {"element_rules": element_rules[:3] + [broken] + element_rules[3:]}
+    parsed = EDIParser().parse_file("samples/edi_850_invalid.txt")
+    expected = ValidationEngine().validate(parsed, rules)
+    result = ValidationEngine().validate_stream(iter(parsed["segments"]), rules, window_size=1)
+    assert [e.to_dict() for e in result.get_all_issues()] == \
+        [e.to_dict() for e in expected.get_all_issues()]
+    assert result.get_all_issues()[-1].rule_id == "SYSTEM_ERROR"
+
+    print("✓ test_validate_stream passed")
+
+
 def test_required_segment_detection():
     """Test that required segment violations are detected."""
     # Parse the invalid 850 (missing segments)
@@ -292,6 +558,12 @@ def run_all_tests():
         test_error_collector()
         test_error_by_segment()
         test_error_by_line()
+        test_error_statistics_order()
+        test_collect_info()
+        test_compiled_conditions()
+        test_segment_index()
+        test_count_match()
+        test_within_loop()
 
         # Integration tests
         test_validate_850_valid()
@@ -299,6 +571,7 @@ def run_all_tests():
         test_validate_850_walmart()
         test_validate_856()
         test_validate_810()
+        test_validate_stream()
 
         # Result methods
         test_validation_result_methods()